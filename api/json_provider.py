@@ -0,0 +1,60 @@
+"""orjson-backed JSON provider for the Flask application."""
+import decimal
+from typing import Any, Union
+
+import orjson
+from flask import Response
+from flask.json.provider import JSONProvider
+
+
+# Dataclasses, datetimes and UUIDs are serialized natively by orjson; NumPy
+# scalars appear in summary statistics computed by the simulation engine.
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types orjson does not support natively.
+
+    Mirrors the extra types handled by Flask's default provider.
+
+    Raises:
+        TypeError: If the object is not serializable
+    """
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider that uses orjson for encoding and decoding.
+
+    Replaces the stdlib ``json`` module used by Flask's default provider,
+    so ``jsonify`` and ``request.get_json`` go through orjson's C encoder
+    and decoder.
+
+    Example:
+        >>> app = Flask(__name__)
+        >>> app.json = OrjsonProvider(app)
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as a JSON string."""
+        return orjson.dumps(obj, default=kwargs.get('default', _default), option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """Deserialize data from a JSON string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Serialize arguments as JSON and wrap them in a response.
+
+        Writes the encoded bytes straight into the response body, skipping
+        the intermediate ``str`` produced by :meth:`dumps`.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS)
+        return self._app.response_class(body, mimetype="application/json")
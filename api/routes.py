@@ -1,15 +1,35 @@
 """Flask REST API routes for simulation service."""
+import atexit
+import hashlib
 import logging
-import uuid
+import multiprocessing
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from operator import attrgetter
 from datetime import datetime
-from typing import Dict, Any
-from dataclasses import asdict
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Tuple
 
-from flask import Blueprint, request, jsonify
+import orjson
+from flask import Blueprint, Response, request, jsonify
+import plotly.graph_objects as go
+from werkzeug.exceptions import RequestEntityTooLarge
 
+from api.json_provider import ORJSON_OPTIONS
 from src.simulation.core import SimulationEngine
 from src.simulation.validators import WorkflowValidator, ScenarioValidator
-from src.simulation.models import SimulationEvent, SimulationSummary
+from src.simulation.models import (
+    DeviceQueueStats,
+    OperationStats,
+    OperationWaitStats,
+    SimulationEvent,
+    SimulationSummary
+)
 from src.simulation.visualization import (
     create_gantt_chart,
     create_utilization_chart,
@@ -25,15 +45,419 @@ logger = logging.getLogger(__name__)
 # Create API blueprint
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
-# In-memory storage for simulation results (Phase 1a)
+# Validators hold no per-call state, so one instance serves all requests
+_workflow_validator = WorkflowValidator()
+_scenario_validator = ScenarioValidator()
+
+# Maximum number of simulation runs kept in memory
+MAX_STORED_RUNS = 100
+
+# In-memory storage for simulation results (Phase 1a), in least-recently-used
+# order so the oldest runs can be evicted once MAX_STORED_RUNS is exceeded.
 # In production, this would be a database
-simulation_results: Dict[str, Dict[str, Any]] = {}
+simulation_results: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_results_lock = threading.Lock()
+
+# Simulations submitted with ?async=true that have not finished yet, in
+# submission order. Like the stored results, this state is per process, so
+# status polls must reach the server process that accepted the run.
+_background_runs: "OrderedDict[str, Future]" = OrderedDict()
+
+# Error messages of background runs that failed or were cancelled, oldest
+# first, so the status endpoint can report them (up to MAX_STORED_RUNS)
+_failed_runs: "OrderedDict[str, str]" = OrderedDict()
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Maximum number of rendered visualization pages kept in memory
+MAX_CACHED_CHARTS = 200
+
+# Rendered chart HTML keyed by (run_id, chart name, chart filter). Stored
+# results never change, so a page only needs to be rendered once; a run's
+# pages are dropped when the run is evicted from result storage.
+_chart_cache: "OrderedDict[Tuple[str, str, Optional[str]], bytes]" = OrderedDict()
+_chart_cache_lock = threading.Lock()
+
+# Run ID of each uploaded results file, keyed by a hash of its JSON body, so
+# re-uploading an identical file reuses the run stored the first time
+_upload_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_upload_cache_lock = threading.Lock()
+
+# Number of events encoded per chunk when streaming the event log
+EVENT_STREAM_BATCH_SIZE = 500
+
+# Event attributes that can be used to filter the event log
+EVENT_FILTER_FIELDS = ('sample_id', 'operation_id', 'device_id', 'event_type')
+
+
+def _build_event_index(events: List[SimulationEvent]) -> Dict[str, Dict[str, List[int]]]:
+    """Index event positions by each filterable event attribute.
+
+    Built once when results are stored so that filtered event queries
+    only touch matching events instead of scanning the full event log.
+
+    Args:
+        events: Event log in timeline order
+
+    Returns:
+        Dictionary mapping field name to {value: ascending event positions}
+    """
+    index = {field: defaultdict(list) for field in EVENT_FILTER_FIELDS}
+    by_sample = index['sample_id']
+    by_operation = index['operation_id']
+    by_device = index['device_id']
+    by_event_type = index['event_type']
+
+    for position, event in enumerate(events):
+        by_sample[event.sample_id].append(position)
+        by_operation[event.operation_id].append(position)
+        by_device[event.device_id].append(position)
+        by_event_type[event.event_type].append(position)
+
+    return {field: dict(values) for field, values in index.items()}
+
+
+def _new_run_id(prefix: str) -> Tuple[str, datetime]:
+    """Generate a unique, time-ordered run identifier.
+
+    Reads the clock once and takes 32 random bits for the suffix, so
+    identifiers sort by creation time.
+
+    Args:
+        prefix: Run ID prefix (e.g. "sim_run" or "uploaded")
+
+    Returns:
+        Tuple of (run_id, creation time)
+    """
+    timestamp_ns = time.time_ns()
+    run_id = f"{prefix}_{timestamp_ns:016x}_{os.urandom(4).hex()}"
+    return run_id, datetime.fromtimestamp(timestamp_ns / 1e9)
+
+
+def _store_result(run_id: str, result: Dict[str, Any]) -> None:
+    """Store a simulation result, evicting least recently used runs.
+
+    Args:
+        run_id: Simulation run identifier
+        result: Result record to store
+    """
+    evicted_run_ids = []
+    with _results_lock:
+        simulation_results[run_id] = result
+        simulation_results.move_to_end(run_id)
+
+        while len(simulation_results) > MAX_STORED_RUNS:
+            evicted_run_id, _ = simulation_results.popitem(last=False)
+            evicted_run_ids.append(evicted_run_id)
+            logger.info(f"Evicted simulation run {evicted_run_id} from result storage")
+
+    if evicted_run_ids:
+        _drop_cached_charts(evicted_run_ids)
+
+
+def _drop_cached_charts(run_ids: List[str]) -> None:
+    """Remove the rendered chart pages of runs that are no longer stored.
+
+    Args:
+        run_ids: Identifiers of evicted simulation runs
+    """
+    run_ids = set(run_ids)
+    with _chart_cache_lock:
+        for key in [key for key in _chart_cache if key[0] in run_ids]:
+            del _chart_cache[key]
+
+
+def _get_result(run_id: str) -> Optional[Dict[str, Any]]:
+    """Look up a stored simulation result and mark it as recently used.
+
+    Args:
+        run_id: Simulation run identifier
+
+    Returns:
+        Stored result record, or None if the run does not exist
+    """
+    with _results_lock:
+        result = simulation_results.get(run_id)
+        if result is not None:
+            simulation_results.move_to_end(run_id)
+    return result
+
+
+def _gunzip(body: bytes, max_size: Optional[int]) -> bytes:
+    """Decompress a gzip request body, stopping once it exceeds a size limit.
+
+    Args:
+        body: gzip-compressed request body
+        max_size: Largest accepted decompressed size in bytes, or None for
+            no limit
+
+    Returns:
+        Decompressed body
+
+    Raises:
+        RequestEntityTooLarge: If the decompressed body exceeds max_size
+        ValueError: If the body is not a complete gzip stream
+    """
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    try:
+        data = decompressor.decompress(body, 0 if max_size is None else max_size + 1)
+    except zlib.error as e:
+        raise ValueError(str(e)) from e
+
+    if max_size is not None and len(data) > max_size:
+        raise RequestEntityTooLarge()
+    if not decompressor.eof:
+        raise ValueError("compressed data ended before the end-of-stream marker")
+    return data
+
+
+def _upload_success(run_id: str, result: Dict[str, Any]):
+    """Build the response for an uploaded results file stored as a run."""
+    return jsonify({
+        "status": "success",
+        "run_id": run_id,
+        "message": "Results loaded successfully",
+        "event_count": len(result['events']),
+        "samples_completed": result['summary'].num_samples_completed
+    }), 200
+
+
+def _run_not_found(run_id: str):
+    """Build the 404 response for an unknown simulation run."""
+    return jsonify({
+        "status": "error",
+        "error_message": f"Simulation run '{run_id}' not found"
+    }), 404
+
+
+def _stream_events(envelope: bytes, events: Iterable[SimulationEvent]) -> Iterator[bytes]:
+    """Stream a JSON object whose trailing "events" array is encoded in batches.
+
+    Events are handed to orjson as dataclasses, which it encodes directly
+    without building an intermediate dict per event. Only one batch is
+    encoded at a time, so peak memory stays flat for large pages and the
+    first bytes go out immediately.
+
+    Args:
+        envelope: Encoded JSON object holding the response metadata
+        events: Events to stream, in output order
+
+    Yields:
+        Chunks of the encoded JSON response body
+    """
+    events = iter(events)
+    yield envelope[:-1] + b',"events":['
+
+    separator = b''
+    while True:
+        batch = list(islice(events, EVENT_STREAM_BATCH_SIZE))
+        if not batch:
+            break
+        # Strip the list brackets so batches join into one array
+        yield separator + orjson.dumps(batch, option=ORJSON_OPTIONS)[1:-1]
+        separator = b','
+
+    yield b']}'
+
+
+def _stream_events_ndjson(events: Iterable[SimulationEvent]) -> Iterator[bytes]:
+    """Stream events as newline-delimited JSON, one event object per line.
+
+    Unlike the JSON array form, every line is a complete document, so
+    clients can decode the page incrementally as it arrives.
+
+    Args:
+        events: Events to stream, in output order
+
+    Yields:
+        Chunks of the encoded NDJSON response body
+    """
+    events = iter(events)
+    while True:
+        batch = list(islice(events, EVENT_STREAM_BATCH_SIZE))
+        if not batch:
+            break
+        yield b''.join(orjson.dumps(event, option=ORJSON_OPTIONS) + b'\n' for event in batch)
+
+
+def _run_simulation(
+    workflow: Dict[str, Any],
+    scenario: Dict[str, Any]
+) -> Tuple[List[SimulationEvent], SimulationSummary, float]:
+    """Run a simulation and time it with the monotonic clock.
+
+    Module-level so it can be pickled into background worker processes.
+
+    Args:
+        workflow: Validated workflow definition
+        scenario: Validated scenario configuration
+
+    Returns:
+        Tuple of (events, summary, execution time in seconds)
+    """
+    start_counter = time.perf_counter()
+    events, summary = SimulationEngine(workflow, scenario).run()
+    return events, summary, time.perf_counter() - start_counter
+
+
+def _store_simulation(
+    run_id: str,
+    start_time: datetime,
+    events: List[SimulationEvent],
+    summary: SimulationSummary,
+    execution_time: float
+) -> None:
+    """Store the results of a completed simulation run.
+
+    The request's workflow and scenario are not kept; no endpoint reads
+    them back, and they would double the memory held per run.
+    """
+    _store_result(run_id, {
+        "run_id": run_id,
+        "events": events,
+        "event_index": _build_event_index(events),
+        "summary": summary,
+        "summary_json": orjson.dumps(summary.to_dict(), option=ORJSON_OPTIONS),
+        "execution_time": execution_time,
+        "timestamp": start_time.isoformat()
+    })
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Return the shared worker pool, creating it on first use.
+
+    Workers are spawned rather than forked, since the pool is created from
+    a request handler thread and forking a threaded process can deadlock.
+    The pool is shut down when the interpreter exits.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            atexit.register(_executor.shutdown, cancel_futures=True)
+        return _executor
+
+
+def _background_run_error(future: Future) -> Optional[str]:
+    """Return the error message of a failed background run.
+
+    Args:
+        future: Future of a finished background run
+
+    Returns:
+        Error message, or None if the run succeeded
+    """
+    if future.cancelled():
+        return "Simulation was cancelled before it completed"
+    error = future.exception()
+    return None if error is None else str(error)
+
+
+def _submit_background_run(
+    run_id: str,
+    start_time: datetime,
+    workflow: Dict[str, Any],
+    scenario: Dict[str, Any]
+) -> None:
+    """Run a simulation in a worker process and store it when it finishes.
+
+    Args:
+        run_id: Simulation run identifier
+        start_time: Wall-clock time the run was submitted
+        workflow: Validated workflow definition
+        scenario: Validated scenario configuration
+    """
+    logger.info(f"Submitting simulation {run_id} to background worker")
+    future = _get_executor().submit(_run_simulation, workflow, scenario)
+
+    with _results_lock:
+        _background_runs[run_id] = future
+        while len(_background_runs) > MAX_STORED_RUNS:
+            _background_runs.popitem(last=False)
+
+    future.add_done_callback(partial(_finish_background_run, run_id, start_time))
+
+
+def _finish_background_run(run_id: str, start_time: datetime, future: Future) -> None:
+    """Store the results of a finished background run.
+
+    Runs that failed, were cancelled, or whose results could not be stored
+    are recorded in the failed run table so the status endpoint can report
+    them. Runs as the future's done callback, so it must not raise: the
+    executor only logs callback errors, and the run would then be reported
+    as running forever.
+    """
+    error = _background_run_error(future)
+    if error is None:
+        events, summary, execution_time = future.result()
+        try:
+            _store_simulation(run_id, start_time, events, summary, execution_time)
+        except Exception as e:
+            logger.error(f"Storing simulation {run_id} failed: {str(e)}", exc_info=True)
+            error = f"Failed to store simulation results: {e}"
+        else:
+            logger.info(f"Simulation {run_id} completed in {execution_time:.3f}s")
+
+    if error is not None:
+        logger.error(f"Simulation {run_id} failed: {error}")
+
+    with _results_lock:
+        _background_runs.pop(run_id, None)
+        if error is not None:
+            _failed_runs[run_id] = error
+            while len(_failed_runs) > MAX_STORED_RUNS:
+                _failed_runs.popitem(last=False)
+
+
+def _chart_response(
+    run_id: str,
+    chart: str,
+    build_figure: Callable[[], go.Figure],
+    chart_filter: Optional[str] = None
+) -> Response:
+    """Serve a visualization page, rendering it only on the first request.
+
+    Args:
+        run_id: Simulation run identifier
+        chart: Name of the visualization endpoint
+        build_figure: Callable that builds the Plotly figure on a cache miss
+        chart_filter: Query parameter value the chart is filtered by, if
+            any; other query parameters do not affect the page
+
+    Returns:
+        HTML response with the rendered chart
+    """
+    key = (run_id, chart, chart_filter)
+
+    with _chart_cache_lock:
+        html = _chart_cache.get(key)
+        if html is not None:
+            _chart_cache.move_to_end(key)
+
+    if html is None:
+        html = build_figure().to_html(full_html=True, include_plotlyjs='cdn').encode('utf-8')
+
+        with _chart_cache_lock:
+            _chart_cache[key] = html
+            while len(_chart_cache) > MAX_CACHED_CHARTS:
+                _chart_cache.popitem(last=False)
+
+    return Response(html, mimetype='text/html')
 
 
 @api_bp.route('/simulate', methods=['POST'])
 def simulate():
     """Execute a simulation with provided workflow and scenario.
 
+    Query Parameters:
+        async: If "true", run the simulation in a background worker process
+            and return immediately (optional, default: false). Run state is
+            kept per server process, so this requires a single-process
+            deployment.
+
     Request Body:
         {
             "workflow": {...},  # Workflow definition
@@ -50,6 +474,13 @@ def simulate():
             "summary": {...}
         }
 
+        202 Accepted: Simulation submitted with ?async=true
+        {
+            "status": "accepted",
+            "run_id": "sim_run_...",
+            "status_url": "/api/simulation/sim_run_.../status"
+        }
+
         400 Bad Request: Validation error
         {
             "status": "validation_error",
@@ -57,6 +488,8 @@ def simulate():
             "warnings": [...]
         }
 
+        413 Payload Too Large: Request body exceeds MAX_CONTENT_LENGTH
+
         500 Internal Server Error: Simulation execution error
         {
             "status": "simulation_error",
@@ -64,8 +497,12 @@ def simulate():
         }
     """
     try:
-        # Parse request JSON
-        data = request.get_json(force=True, silent=True)
+        # Parse request JSON straight from the body bytes, without Flask
+        # caching the raw body on the request
+        try:
+            data = orjson.loads(request.get_data(cache=False))
+        except orjson.JSONDecodeError:
+            data = None
 
         if not data:
             return jsonify({
@@ -83,8 +520,7 @@ def simulate():
             }), 400
 
         # Validate workflow
-        workflow_validator = WorkflowValidator()
-        workflow_result = workflow_validator.validate(workflow)
+        workflow_result = _workflow_validator.validate(workflow)
 
         if not workflow_result.is_valid:
             return jsonify({
@@ -94,8 +530,7 @@ def simulate():
             }), 400
 
         # Validate scenario
-        scenario_validator = ScenarioValidator()
-        scenario_result = scenario_validator.validate(scenario, workflow)
+        scenario_result = _scenario_validator.validate(scenario, workflow)
 
         if not scenario_result.is_valid:
             return jsonify({
@@ -105,46 +540,24 @@ def simulate():
             }), 400
 
         # Generate unique run ID
-        run_id = f"sim_run_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        run_id, start_time = _new_run_id("sim_run")
 
-        # Execute simulation
-        start_time = datetime.now()
+        if request.args.get('async', '').lower() in ('1', 'true'):
+            _submit_background_run(run_id, start_time, workflow, scenario)
+            return jsonify({
+                "status": "accepted",
+                "run_id": run_id,
+                "status_url": f"/api/simulation/{run_id}/status"
+            }), 202
 
         logger.info(f"Starting simulation {run_id}")
-        engine = SimulationEngine(workflow, scenario)
-        events, summary = engine.run()
-
-        end_time = datetime.now()
-        execution_time = (end_time - start_time).total_seconds()
-
+        events, summary, execution_time = _run_simulation(workflow, scenario)
         logger.info(f"Simulation {run_id} completed in {execution_time:.3f}s")
 
-        # Store results
-        simulation_results[run_id] = {
-            "run_id": run_id,
-            "workflow": workflow,
-            "scenario": scenario,
-            "events": events,
-            "summary": summary,
-            "execution_time": execution_time,
-            "timestamp": start_time.isoformat()
-        }
+        _store_simulation(run_id, start_time, events, summary, execution_time)
 
         # Prepare summary for JSON serialization
-        summary_dict = asdict(summary)
-
-        # Convert dataclass fields in summary_dict
-        for device_id, queue_stats in summary_dict['device_queue_stats'].items():
-            if hasattr(queue_stats, '__dict__'):
-                summary_dict['device_queue_stats'][device_id] = asdict(queue_stats)
-
-        for op_id, op_stats in summary_dict['operation_stats'].items():
-            if hasattr(op_stats, '__dict__'):
-                summary_dict['operation_stats'][op_id] = asdict(op_stats)
-
-        for op_id, wait_stats in summary_dict['operation_wait_times'].items():
-            if hasattr(wait_stats, '__dict__'):
-                summary_dict['operation_wait_times'][op_id] = asdict(wait_stats)
+        summary_dict = summary.to_dict()
 
         return jsonify({
             "status": "success",
@@ -154,6 +567,12 @@ def simulate():
             "summary": summary_dict
         }), 200
 
+    except RequestEntityTooLarge:
+        return jsonify({
+            "status": "error",
+            "error_message": f"Request body exceeds the maximum size of {request.max_content_length} bytes"
+        }), 413
+
     except Exception as e:
         logger.error(f"Simulation error: {str(e)}", exc_info=True)
         return jsonify({
@@ -162,6 +581,58 @@ def simulate():
         }), 500
 
 
+@api_bp.route('/simulation/<run_id>/status', methods=['GET'])
+def get_status(run_id: str):
+    """Report the state of a simulation run.
+
+    Path Parameters:
+        run_id: Simulation run identifier
+
+    Returns:
+        200 OK: Run exists; "state" is one of "running", "complete", "failed"
+        {
+            "status": "success",
+            "run_id": "sim_run_...",
+            "state": "complete",
+            "event_count": 15,
+            "execution_time_sec": 0.123
+        }
+
+        404 Not Found: Run ID does not exist
+    """
+    result = _get_result(run_id)
+    if result is not None:
+        return jsonify({
+            "status": "success",
+            "run_id": run_id,
+            "state": "complete",
+            "event_count": len(result['events']),
+            "execution_time_sec": result['execution_time']
+        }), 200
+
+    with _results_lock:
+        error = _failed_runs.get(run_id)
+        running = run_id in _background_runs
+
+    if error is not None:
+        return jsonify({
+            "status": "simulation_error",
+            "run_id": run_id,
+            "state": "failed",
+            "error_message": error
+        }), 200
+
+    if not running:
+        return _run_not_found(run_id)
+
+    # Finished runs are reported as running until their results are stored
+    return jsonify({
+        "status": "success",
+        "run_id": run_id,
+        "state": "running"
+    }), 200
+
+
 @api_bp.route('/simulation/<run_id>/events', methods=['GET'])
 def get_events(run_id: str):
     """Retrieve event log from a completed simulation.
@@ -174,20 +645,19 @@ def get_events(run_id: str):
         operation_id: Filter by operation ID (optional)
         device_id: Filter by device ID (optional)
         event_type: Filter by event type (optional)
-        limit: Maximum number of events to return (default: 1000)
-        offset: Pagination offset (default: 0)
+        limit: Maximum number of events to return (default: 1000, negative treated as 0)
+        offset: Pagination offset (default: 0, negative treated as 0)
+        format: "ndjson" to stream the page as newline-delimited JSON events,
+            with the total match count in the X-Total-Events header (optional)
 
     Returns:
         200 OK: Events retrieved successfully
         404 Not Found: Run ID does not exist
     """
-    if run_id not in simulation_results:
-        return jsonify({
-            "status": "error",
-            "error_message": f"Simulation run '{run_id}' not found"
-        }), 404
+    result = _get_result(run_id)
+    if result is None:
+        return _run_not_found(run_id)
 
-    result = simulation_results[run_id]
     events = result['events']
 
     # Apply filters
@@ -196,30 +666,48 @@ def get_events(run_id: str):
     device_id = request.args.get('device_id')
     event_type = request.args.get('event_type')
 
-    filtered_events = events
-
-    if sample_id:
-        filtered_events = [e for e in filtered_events if e.sample_id == sample_id]
-
-    if operation_id:
-        filtered_events = [e for e in filtered_events if e.operation_id == operation_id]
-
-    if device_id:
-        filtered_events = [e for e in filtered_events if e.device_id == device_id]
-
-    if event_type:
-        filtered_events = [e for e in filtered_events if e.event_type == event_type]
+    active_filters = [
+        (field, value)
+        for field, value in zip(EVENT_FILTER_FIELDS, (sample_id, operation_id, device_id, event_type))
+        if value
+    ]
 
     # Apply pagination
-    limit = int(request.args.get('limit', 1000))
-    offset = int(request.args.get('offset', 0))
-
-    paginated_events = filtered_events[offset:offset + limit]
-
-    # Convert events to dict
-    events_dict = [asdict(e) for e in paginated_events]
-
-    return jsonify({
+    limit = max(int(request.args.get('limit', 1000)), 0)
+    offset = max(int(request.args.get('offset', 0)), 0)
+
+    if active_filters:
+        # Start from the most selective filter's indexed positions, then check
+        # the remaining filters in one pass over those events
+        event_index = result['event_index']
+        (field, value), *remaining = sorted(
+            active_filters,
+            key=lambda item: len(event_index[item[0]].get(item[1], ()))
+        )
+        positions = event_index[field].get(value, [])
+
+        if remaining:
+            fields, values = zip(*remaining)
+            get_fields = attrgetter(*fields)
+            # attrgetter returns a bare value for a single field
+            expected = values if len(values) > 1 else values[0]
+            positions = [i for i in positions if get_fields(events[i]) == expected]
+
+        total_events = len(positions)
+        page = (events[i] for i in islice(positions, offset, offset + limit))
+    else:
+        total_events = len(events)
+        page = islice(events, offset, offset + limit)
+
+    if request.args.get('format') == 'ndjson':
+        return Response(
+            _stream_events_ndjson(page),
+            mimetype='application/x-ndjson',
+            headers={'X-Total-Events': str(total_events)}
+        ), 200
+
+    # Envelope is encoded up front; events follow as a streamed JSON array
+    envelope = orjson.dumps({
         "status": "success",
         "run_id": run_id,
         "filter_applied": {
@@ -228,10 +716,11 @@ def get_events(run_id: str):
             "device_id": device_id,
             "event_type": event_type
         },
-        "event_count": len(paginated_events),
-        "total_events": len(filtered_events),
-        "events": events_dict
-    }), 200
+        "event_count": max(min(limit, total_events - offset), 0),
+        "total_events": total_events
+    }, option=ORJSON_OPTIONS)
+
+    return Response(_stream_events(envelope, page), mimetype='application/json'), 200
 
 
 @api_bp.route('/simulation/<run_id>/summary', methods=['GET'])
@@ -245,36 +734,17 @@ def get_summary(run_id: str):
         200 OK: Summary retrieved successfully
         404 Not Found: Run ID does not exist
     """
-    if run_id not in simulation_results:
-        return jsonify({
-            "status": "error",
-            "error_message": f"Simulation run '{run_id}' not found"
-        }), 404
-
-    result = simulation_results[run_id]
-    summary = result['summary']
-
-    # Convert summary to dict
-    summary_dict = asdict(summary)
-
-    # Convert nested dataclasses
-    for device_id, queue_stats in summary_dict['device_queue_stats'].items():
-        if hasattr(queue_stats, '__dict__'):
-            summary_dict['device_queue_stats'][device_id] = asdict(queue_stats)
-
-    for op_id, op_stats in summary_dict['operation_stats'].items():
-        if hasattr(op_stats, '__dict__'):
-            summary_dict['operation_stats'][op_id] = asdict(op_stats)
-
-    for op_id, wait_stats in summary_dict['operation_wait_times'].items():
-        if hasattr(wait_stats, '__dict__'):
-            summary_dict['operation_wait_times'][op_id] = asdict(wait_stats)
-
-    return jsonify({
-        "status": "success",
-        "run_id": run_id,
-        "summary": summary_dict
-    }), 200
+    result = _get_result(run_id)
+    if result is None:
+        return _run_not_found(run_id)
+
+    # The summary is serialized once when the run is stored; each request
+    # only splices the cached bytes into the envelope.
+    body = (
+        b'{"status":"success","run_id":' + orjson.dumps(run_id)
+        + b',"summary":' + result['summary_json'] + b'}'
+    )
+    return Response(body, mimetype='application/json'), 200
 
 
 @api_bp.route('/health', methods=['GET'])
@@ -302,18 +772,16 @@ def visualize_gantt(run_id: str):
         200 OK: HTML with interactive Gantt chart
         404 Not Found: Run ID does not exist
     """
-    if run_id not in simulation_results:
-        return jsonify({
-            "status": "error",
-            "error_message": f"Simulation run '{run_id}' not found"
-        }), 404
+    result = _get_result(run_id)
+    if result is None:
+        return _run_not_found(run_id)
 
-    result = simulation_results[run_id]
     events = result['events']
 
-    fig = create_gantt_chart(events, title=f"Device Operations - {run_id}")
-
-    return fig.to_html(full_html=True, include_plotlyjs='cdn')
+    return _chart_response(
+        run_id, 'gantt',
+        lambda: create_gantt_chart(events, title=f"Device Operations - {run_id}")
+    )
 
 
 @api_bp.route('/simulation/<run_id>/visualize/utilization', methods=['GET'])
@@ -327,18 +795,16 @@ def visualize_utilization(run_id: str):
         200 OK: HTML with interactive utilization chart
         404 Not Found: Run ID does not exist
     """
-    if run_id not in simulation_results:
-        return jsonify({
-            "status": "error",
-            "error_message": f"Simulation run '{run_id}' not found"
-        }), 404
+    result = _get_result(run_id)
+    if result is None:
+        return _run_not_found(run_id)
 
-    result = simulation_results[run_id]
     summary = result['summary']
 
-    fig = create_utilization_chart(summary, title=f"Device Utilization - {run_id}")
-
-    return fig.to_html(full_html=True, include_plotlyjs='cdn')
+    return _chart_response(
+        run_id, 'utilization',
+        lambda: create_utilization_chart(summary, title=f"Device Utilization - {run_id}")
+    )
 
 
 @api_bp.route('/simulation/<run_id>/visualize/queue', methods=['GET'])
@@ -355,24 +821,23 @@ def visualize_queue(run_id: str):
         200 OK: HTML with interactive queue timeline
         404 Not Found: Run ID does not exist
     """
-    if run_id not in simulation_results:
-        return jsonify({
-            "status": "error",
-            "error_message": f"Simulation run '{run_id}' not found"
-        }), 404
+    result = _get_result(run_id)
+    if result is None:
+        return _run_not_found(run_id)
 
-    result = simulation_results[run_id]
     events = result['events']
     device_id = request.args.get('device_id')
 
-    fig = create_queue_timeline(
-        events,
-        device_id=device_id,
-        title=f"Queue Length Over Time - {run_id}"
+    return _chart_response(
+        run_id, 'queue',
+        lambda: create_queue_timeline(
+            events,
+            device_id=device_id,
+            title=f"Queue Length Over Time - {run_id}"
+        ),
+        device_id
     )
 
-    return fig.to_html(full_html=True, include_plotlyjs='cdn')
-
 
 @api_bp.route('/simulation/<run_id>/visualize/sample', methods=['GET'])
 def visualize_sample(run_id: str):
@@ -388,24 +853,23 @@ def visualize_sample(run_id: str):
         200 OK: HTML with interactive sample journey chart
         404 Not Found: Run ID does not exist
     """
-    if run_id not in simulation_results:
-        return jsonify({
-            "status": "error",
-            "error_message": f"Simulation run '{run_id}' not found"
-        }), 404
+    result = _get_result(run_id)
+    if result is None:
+        return _run_not_found(run_id)
 
-    result = simulation_results[run_id]
     events = result['events']
     sample_id = request.args.get('sample_id')
 
-    fig = create_sample_journey_chart(
-        events,
-        sample_id=sample_id,
-        title=f"Sample Journey - {run_id}"
+    return _chart_response(
+        run_id, 'sample',
+        lambda: create_sample_journey_chart(
+            events,
+            sample_id=sample_id,
+            title=f"Sample Journey - {run_id}"
+        ),
+        sample_id
     )
 
-    return fig.to_html(full_html=True, include_plotlyjs='cdn')
-
 
 @api_bp.route('/simulation/<run_id>/visualize/operations', methods=['GET'])
 def visualize_operations(run_id: str):
@@ -418,18 +882,16 @@ def visualize_operations(run_id: str):
         200 OK: HTML with interactive operation stats chart
         404 Not Found: Run ID does not exist
     """
-    if run_id not in simulation_results:
-        return jsonify({
-            "status": "error",
-            "error_message": f"Simulation run '{run_id}' not found"
-        }), 404
+    result = _get_result(run_id)
+    if result is None:
+        return _run_not_found(run_id)
 
-    result = simulation_results[run_id]
     summary = result['summary']
 
-    fig = create_operation_stats_chart(summary, title=f"Operation Statistics - {run_id}")
-
-    return fig.to_html(full_html=True, include_plotlyjs='cdn')
+    return _chart_response(
+        run_id, 'operations',
+        lambda: create_operation_stats_chart(summary, title=f"Operation Statistics - {run_id}")
+    )
 
 
 @api_bp.route('/simulation/<run_id>/visualize/dashboard', methods=['GET'])
@@ -443,19 +905,17 @@ def visualize_dashboard(run_id: str):
         200 OK: HTML with interactive dashboard
         404 Not Found: Run ID does not exist
     """
-    if run_id not in simulation_results:
-        return jsonify({
-            "status": "error",
-            "error_message": f"Simulation run '{run_id}' not found"
-        }), 404
+    result = _get_result(run_id)
+    if result is None:
+        return _run_not_found(run_id)
 
-    result = simulation_results[run_id]
     events = result['events']
     summary = result['summary']
 
-    fig = create_dashboard(events, summary, title=f"Simulation Dashboard - {run_id}")
-
-    return fig.to_html(full_html=True, include_plotlyjs='cdn')
+    return _chart_response(
+        run_id, 'dashboard',
+        lambda: create_dashboard(events, summary, title=f"Simulation Dashboard - {run_id}")
+    )
 
 
 @api_bp.route('/upload-results', methods=['POST'])
@@ -463,7 +923,9 @@ def upload_results():
     """Upload simulation results JSON file for visualization.
 
     Request:
-        Form data with file upload (key: 'file')
+        Either the results JSON document as the raw request body
+        (Content-Type: application/json, optionally with
+        Content-Encoding: gzip), or form data with file upload (key: 'file')
 
     Returns:
         200 OK: File uploaded and processed successfully
@@ -478,43 +940,68 @@ def upload_results():
             "status": "error",
             "error_message": "..."
         }
+
+        413 Payload Too Large: Upload exceeds MAX_CONTENT_LENGTH bytes
     """
     try:
-        # Check if file is in request
-        if 'file' not in request.files:
-            return jsonify({
-                "status": "error",
-                "error_message": "No file provided"
-            }), 400
-
-        file = request.files['file']
-
-        # Check if filename is present
-        if file.filename == '':
-            return jsonify({
-                "status": "error",
-                "error_message": "No file selected"
-            }), 400
-
-        # Check file extension
-        if not file.filename.endswith('.json'):
-            return jsonify({
-                "status": "error",
-                "error_message": "File must be a JSON file"
-            }), 400
-
-        # Read and parse JSON
-        import json
+        if request.mimetype == 'application/json':
+            # Raw document body, as sent by the web UI; no multipart parsing
+            body = request.get_data(cache=False)
+
+            if request.content_encoding == 'gzip':
+                try:
+                    body = _gunzip(body, request.max_content_length)
+                except ValueError as e:
+                    return jsonify({
+                        "status": "error",
+                        "error_message": f"Invalid gzip body: {str(e)}"
+                    }), 400
+        else:
+            # Check if file is in request
+            if 'file' not in request.files:
+                return jsonify({
+                    "status": "error",
+                    "error_message": "No file provided"
+                }), 400
+
+            file = request.files['file']
+
+            # Check if filename is present
+            if file.filename == '':
+                return jsonify({
+                    "status": "error",
+                    "error_message": "No file selected"
+                }), 400
+
+            # Check file extension
+            if not file.filename.endswith('.json'):
+                return jsonify({
+                    "status": "error",
+                    "error_message": "File must be a JSON file"
+                }), 400
+
+            body = file.read()
+
+        # An identical file uploaded before is still stored under its run ID
+        upload_key = hashlib.blake2b(body, digest_size=16).digest()
+        with _upload_cache_lock:
+            cached_run_id = _upload_cache.get(upload_key)
+        if cached_run_id is not None:
+            cached_result = _get_result(cached_run_id)
+            if cached_result is not None:
+                return _upload_success(cached_run_id, cached_result)
+
+        # Parse JSON
         try:
-            data = json.load(file)
-        except json.JSONDecodeError as e:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError as e:
             return jsonify({
                 "status": "error",
                 "error_message": f"Invalid JSON format: {str(e)}"
             }), 400
 
         # Generate unique run ID for uploaded file
-        run_id = f"uploaded_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        run_id, uploaded_at = _new_run_id("uploaded")
 
         # Validate structure - check for required fields
         required_fields = ['workflow', 'scenario', 'events', 'summary']
@@ -527,28 +1014,30 @@ def upload_results():
             }), 400
 
         # Convert events from dict to SimulationEvent objects
-        events = []
-        for event_dict in data['events']:
-            events.append(SimulationEvent(**event_dict))
+        from_dict = SimulationEvent.from_dict
+        events = [from_dict(event_dict) for event_dict in data['events']]
 
         # Convert summary from dict to SimulationSummary object
-        # Need to handle nested dataclasses
-        from src.simulation.models import DeviceQueueStats, OperationStats, OperationWaitStats
-
         summary_dict = data['summary']
 
         # Convert nested dataclasses
-        device_queue_stats = {}
-        for device_id, stats_dict in summary_dict['device_queue_stats'].items():
-            device_queue_stats[device_id] = DeviceQueueStats(**stats_dict)
+        queue_from_dict = DeviceQueueStats.from_dict
+        device_queue_stats = {
+            device_id: queue_from_dict(stats_dict)
+            for device_id, stats_dict in summary_dict['device_queue_stats'].items()
+        }
 
-        operation_stats = {}
-        for op_id, stats_dict in summary_dict['operation_stats'].items():
-            operation_stats[op_id] = OperationStats(**stats_dict)
+        op_from_dict = OperationStats.from_dict
+        operation_stats = {
+            op_id: op_from_dict(stats_dict)
+            for op_id, stats_dict in summary_dict['operation_stats'].items()
+        }
 
-        operation_wait_times = {}
-        for op_id, stats_dict in summary_dict['operation_wait_times'].items():
-            operation_wait_times[op_id] = OperationWaitStats(**stats_dict)
+        wait_from_dict = OperationWaitStats.from_dict
+        operation_wait_times = {
+            op_id: wait_from_dict(stats_dict)
+            for op_id, stats_dict in summary_dict['operation_wait_times'].items()
+        }
 
         summary = SimulationSummary(
             total_simulation_time=summary_dict['total_simulation_time'],
@@ -568,25 +1057,31 @@ def upload_results():
         )
 
         # Store in simulation_results
-        simulation_results[run_id] = {
+        result = {
             "run_id": run_id,
-            "workflow": data['workflow'],
-            "scenario": data['scenario'],
             "events": events,
+            "event_index": _build_event_index(events),
             "summary": summary,
+            "summary_json": orjson.dumps(summary.to_dict(), option=ORJSON_OPTIONS),
             "execution_time": data.get('execution_time', 0.0),
-            "timestamp": data.get('timestamp', datetime.now().isoformat())
+            "timestamp": data.get('timestamp', uploaded_at.isoformat())
         }
+        _store_result(run_id, result)
+
+        with _upload_cache_lock:
+            _upload_cache[upload_key] = run_id
+            while len(_upload_cache) > MAX_STORED_RUNS:
+                _upload_cache.popitem(last=False)
 
         logger.info(f"Uploaded simulation results stored as {run_id}")
 
+        return _upload_success(run_id, result)
+
+    except RequestEntityTooLarge:
         return jsonify({
-            "status": "success",
-            "run_id": run_id,
-            "message": "Results loaded successfully",
-            "event_count": len(events),
-            "samples_completed": summary.num_samples_completed
-        }), 200
+            "status": "error",
+            "error_message": f"File exceeds the maximum upload size of {request.max_content_length} bytes"
+        }), 413
 
     except Exception as e:
         logger.error(f"Upload error: {str(e)}", exc_info=True)
@@ -1,1151 +1,406 @@
 """Main Flask application entry point."""
+import gzip
+import hashlib
 import logging
-from flask import Flask, render_template_string
-from flask_cors import CORS
+import os
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 
+import orjson
+from flask import Flask, Response, abort, current_app, request, send_from_directory
+from werkzeug.exceptions import NotFound
+from werkzeug.wrappers import Request
+
+from api.json_provider import OrjsonProvider
 from api.routes import api_bp
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(BASE_DIR, 'static')
+EXAMPLES_DIR = os.path.join(BASE_DIR, 'examples')
+INDEX_FILENAME = 'index.html'
+INDEX_MAX_AGE = 3600
+EXAMPLES_MAX_AGE = 86400
+# Asset URLs carry a content fingerprint, so they can be cached for a year
+ASSET_MAX_AGE = 31536000
+CORS_MAX_AGE = '86400'
+ASSET_MIMETYPES = {
+    'app.css': 'text/css',
+    'app.js': 'text/javascript'
+}
+
+# Largest accepted request body, in bytes; results files from 100000-event
+# runs are around 25 MB
+DEFAULT_MAX_CONTENT_LENGTH = 64 * 1024 * 1024
+
+
+def _read(path: str) -> bytes:
+    """Read a file's contents."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _minify_lines(body: bytes) -> bytes:
+    """Strip indentation and blank lines from an HTML, CSS or JS file.
+
+    Line breaks are kept, so whitespace between inline elements and
+    JavaScript's automatic semicolon insertion are unaffected. The pages
+    have no ``<pre>`` blocks or prefilled ``<textarea>`` whose content
+    would change.
+    """
+    return b'\n'.join(line for line in (raw.strip() for raw in body.splitlines()) if line)
 
-def create_app():
-    """Create and configure Flask application.
+
+def _minify_json(body: bytes) -> bytes:
+    """Re-encode a JSON document without indentation."""
+    return orjson.dumps(orjson.loads(body))
+
+
+def _precompress(
+    body: bytes,
+    minify: Optional[Callable[[bytes], bytes]] = None
+) -> Tuple[str, bytes, str]:
+    """Prepare the minified gzip representation of a static file.
+
+    Each encoding is a distinct representation and gets its own strong ETag.
+
+    Args:
+        body: File contents
+        minify: Function that minifies the file before compression, if any
 
     Returns:
-        Configured Flask app instance
+        Tuple of (ETag, gzip-compressed body, gzip ETag)
+    """
+    etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+    if minify is not None:
+        body = minify(body)
+    # mtime=0 keeps the compressed output deterministic
+    body_gzip = gzip.compress(body, compresslevel=9, mtime=0)
+    return etag, body_gzip, f"{etag}-gzip"
+
+
+def _asset_url(name: str) -> str:
+    """Return the fingerprinted URL of a static asset."""
+    etag = _ASSETS_PRECOMPRESSED[name][0]
+    return f'/static/{name}?v={etag[:12]}'
+
+
+def _fingerprint_assets(html: bytes) -> bytes:
+    """Append a content hash to every static asset URL in a page."""
+    for name in _ASSETS_PRECOMPRESSED:
+        html = html.replace(f'/static/{name}"'.encode(), f'{_asset_url(name)}"'.encode())
+    return html
+
+
+# Static files are minified, compressed and hashed once at import and shared
+# by every app instance. Uncompressed assets are streamed from disk by
+# send_file. The index page (whose asset URLs are rewritten with
+# fingerprints) and the small example files are served from memory.
+_ASSETS_PRECOMPRESSED = {
+    name: _precompress(_read(os.path.join(STATIC_DIR, name)), _minify_lines)
+    for name in ASSET_MIMETYPES
+}
+_EXAMPLE_BODIES = {
+    name: _read(os.path.join(EXAMPLES_DIR, name))
+    for name in sorted(os.listdir(EXAMPLES_DIR))
+    if name.endswith('.json')
+}
+_EXAMPLES_PRECOMPRESSED = {
+    name: _precompress(body, _minify_json)
+    for name, body in _EXAMPLE_BODIES.items()
+}
+# All examples in one compact document, keyed by name without extension
+_EXAMPLES_LIST_BODY = orjson.dumps({
+    os.path.splitext(name)[0]: orjson.loads(body)
+    for name, body in _EXAMPLE_BODIES.items()
+})
+_EXAMPLES_LIST_PRECOMPRESSED = _precompress(_EXAMPLES_LIST_BODY)
+_INDEX_BODY = _fingerprint_assets(_read(os.path.join(STATIC_DIR, INDEX_FILENAME)))
+_INDEX_PRECOMPRESSED = _precompress(_INDEX_BODY, _minify_lines)
+# Lets the browser start fetching the assets as soon as the headers arrive
+_INDEX_PRELOAD_LINKS = ', '.join(
+    f'<{_asset_url(name)}>; rel=preload; as={"style" if mimetype == "text/css" else "script"}'
+    for name, mimetype in ASSET_MIMETYPES.items()
+)
+
+
+def _cached_response(
+    req: Request,
+    body: bytes,
+    etag: str,
+    mimetype: str,
+    cache_control: str,
+    content_encoding: Optional[str] = None
+) -> Response:
+    """Build a response for an in-memory body, honoring If-None-Match.
+
+    Args:
+        req: Request being answered
+        body: Response body
+        etag: Strong ETag of the body
+        mimetype: Content type of the uncompressed body
+        cache_control: Cache-Control header value
+        content_encoding: Content-Encoding of the body, if compressed
+
+    Returns:
+        200 response with the body, or 304 if the client's copy is current
+    """
+    headers = {
+        'Cache-Control': cache_control,
+        'Vary': 'Accept-Encoding',
+        'ETag': f'"{etag}"'
+    }
+
+    if etag in req.if_none_match:
+        return Response(status=304, headers=headers)
+
+    if content_encoding:
+        headers['Content-Encoding'] = content_encoding
+    return Response(body, mimetype=mimetype, headers=headers)
+
+
+def _send_cached(
+    req: Request,
+    body: bytes,
+    precompressed: Tuple[str, bytes, str],
+    mimetype: str,
+    max_age: int
+) -> Response:
+    """Send an in-memory file, using its precompressed copy when gzip is accepted.
+
+    Args:
+        req: Request being answered
+        body: Uncompressed file contents
+        precompressed: Result of :func:`_precompress` for the file
+        mimetype: Content type of the uncompressed file
+        max_age: Cache lifetime in seconds
+
+    Returns:
+        200 response with the file, or 304 if the client's copy is current
     """
-    app = Flask(__name__)
+    etag, body_gzip, etag_gzip = precompressed
+    cache_control = f'public, max-age={max_age}'
+
+    if req.accept_encodings['gzip']:
+        return _cached_response(req, body_gzip, etag_gzip, mimetype, cache_control, 'gzip')
+
+    return _cached_response(req, body, etag, mimetype, cache_control)
+
+
+def _send_static(
+    directory: str,
+    filename: str,
+    mimetype: str,
+    max_age: int,
+    precompressed: Tuple[str, bytes, str],
+    immutable: bool = False
+) -> Response:
+    """Send a static file, using its precompressed copy when gzip is accepted.
+
+    Args:
+        directory: Directory holding the file
+        filename: Name of the file within the directory
+        mimetype: Content type of the uncompressed file
+        max_age: Cache lifetime in seconds
+        precompressed: Result of :func:`_precompress` for the file
+        immutable: Whether clients may skip revalidation within max_age
+
+    Returns:
+        200 response with the file, or 304 if the client's copy is current
+    """
+    etag, body_gzip, etag_gzip = precompressed
+
+    if request.accept_encodings['gzip']:
+        cache_control = f'public, max-age={max_age}'
+        if immutable:
+            cache_control += ', immutable'
+        return _cached_response(request, body_gzip, etag_gzip, mimetype, cache_control, 'gzip')
+
+    # conditional=True handles If-None-Match and Range requests, and
+    # WSGI servers with wsgi.file_wrapper can sendfile() the body
+    response = send_from_directory(
+        directory,
+        filename,
+        mimetype=mimetype,
+        conditional=True,
+        etag=etag,
+        max_age=max_age
+    )
+    response.vary.add('Accept-Encoding')
+    if immutable:
+        response.cache_control.immutable = True
+    return response
+
+
+class ExampleFilesMiddleware:
+    """WSGI middleware that serves ``/examples/<filename>`` ahead of Flask.
+
+    Examples are small and read once at import, so they are answered from
+    memory before URL routing, request hooks and view dispatch run. They
+    only change on deploy, so clients may cache them for a day and then
+    revalidate against their ETag.
+
+    Example:
+        >>> app.wsgi_app = ExampleFilesMiddleware(app.wsgi_app)
+    """
+
+    PREFIX = '/examples/'
 
-    # Configure logging
+    def __init__(self, wsgi_app: Callable) -> None:
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        path = environ.get('PATH_INFO', '')
+        if not path.startswith(self.PREFIX) or environ['REQUEST_METHOD'] not in ('GET', 'HEAD'):
+            return self.wsgi_app(environ, start_response)
+
+        filename = path[len(self.PREFIX):]
+        body = _EXAMPLE_BODIES.get(filename)
+        if body is None:
+            return NotFound()(environ, start_response)
+
+        response = _send_cached(
+            Request(environ),
+            body,
+            _EXAMPLES_PRECOMPRESSED[filename],
+            'application/json',
+            EXAMPLES_MAX_AGE
+        )
+        return response(environ, start_response)
+
+
+def list_examples() -> Response:
+    """Return every example workflow in one response, keyed by name.
+
+    Lets the index page fetch all examples in a single request instead of
+    one request per selection.
+    """
+    return _send_cached(
+        request,
+        _EXAMPLES_LIST_BODY,
+        _EXAMPLES_LIST_PRECOMPRESSED,
+        'application/json',
+        EXAMPLES_MAX_AGE
+    )
+
+
+def serve_asset(filename: str) -> Response:
+    """Serve the index page's stylesheet and script."""
+    precompressed = _ASSETS_PRECOMPRESSED.get(filename)
+    if precompressed is None:
+        abort(404)
+
+    return _send_static(
+        STATIC_DIR,
+        filename,
+        ASSET_MIMETYPES[filename],
+        ASSET_MAX_AGE,
+        precompressed,
+        immutable=True
+    )
+
+
+def index():
+    """Root endpoint with HTML documentation.
+
+    The page is small and served from memory in a single body; a Link
+    header lets the browser fetch its stylesheet and script in parallel
+    with parsing it.
+    """
+    response = _send_cached(request, _INDEX_BODY, _INDEX_PRECOMPRESSED, 'text/html', INDEX_MAX_AGE)
+    response.headers['Link'] = _INDEX_PRELOAD_LINKS
+    return response
+
+
+def add_cors_headers(response: Response) -> Response:
+    """Allow cross-origin access to the JSON API.
+
+    Only ``/api/`` responses get CORS headers; the index page and example
+    files are served same-origin. Preflight ``OPTIONS`` requests are answered
+    by Flask's automatic OPTIONS handling and pick up the headers here, and
+    browsers may cache the preflight result for a day.
+    """
+    if not request.path.startswith('/api/'):
+        return response
+
+    allowed_origins = current_app.config['CORS_ALLOWED_ORIGINS']
+    if '*' in allowed_origins:
+        allow_origin = '*'
+    else:
+        # The header depends on the caller, so caches must key on Origin
+        response.vary.add('Origin')
+        allow_origin = request.headers.get('Origin')
+        if allow_origin not in allowed_origins:
+            return response
+
+    headers = response.headers
+    headers['Access-Control-Allow-Origin'] = allow_origin
+    headers['Access-Control-Allow-Headers'] = 'Content-Type, Content-Encoding'
+    headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
+    headers['Access-Control-Max-Age'] = CORS_MAX_AGE
+    return response
+
+
+def configure_logging() -> None:
+    """Configure process-wide logging for an entry point.
+
+    The level comes from the LOG_LEVEL environment variable and defaults to
+    WARNING. Records carry no timestamp, which the WSGI server or process
+    supervisor adds, and skip the thread/process attributes nothing reads.
+    """
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        level=os.environ.get('LOG_LEVEL', 'WARNING').upper(),
+        format='%(name)s %(levelname)s %(message)s'
     )
 
-    # Enable CORS
-    CORS(app)
+
+def create_app():
+    """Create and configure Flask application.
+
+    Returns:
+        Configured Flask app instance
+    """
+    # Static files are served by serve_asset, which only exposes the assets
+    # the index page references
+    app = Flask(__name__, static_folder=None)
+    app.json = OrjsonProvider(app)
+
+    # Behind nginx/Apache, hand file bodies to the front-end server via
+    # X-Sendfile instead of reading them through Python
+    app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE', '').lower() in ('1', 'true')
+
+    # Reject request bodies above MAX_CONTENT_LENGTH bytes before they are
+    # read, so an oversized upload cannot exhaust memory
+    app.config['MAX_CONTENT_LENGTH'] = int(os.environ.get('MAX_CONTENT_LENGTH', DEFAULT_MAX_CONTENT_LENGTH))
+
+    # Enable CORS for the API only; CORS_ALLOWED_ORIGINS is a comma-separated
+    # list of origins, or "*" for any
+    app.config['CORS_ALLOWED_ORIGINS'] = frozenset(
+        origin.strip()
+        for origin in os.environ.get('CORS_ALLOWED_ORIGINS', '*').split(',')
+        if origin.strip()
+    )
+    app.after_request(add_cors_headers)
 
     # Register blueprints
     app.register_blueprint(api_bp)
 
-    @app.route('/examples/<filename>')
-    def serve_example(filename):
-        """Serve example workflow files."""
-        from flask import send_from_directory
-        import os
-        examples_dir = os.path.join(os.path.dirname(__file__), 'examples')
-        return send_from_directory(examples_dir, filename)
-
-    @app.route('/')
-    def index():
-        """Root endpoint with HTML documentation."""
-        html = """
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Instrument Workflow Simulator</title>
-            <script src="https://cdnjs.cloudflare.com/ajax/libs/cytoscape/3.28.1/cytoscape.min.js"></script>
-            <script src="https://cdn.jsdelivr.net/npm/dagre@0.8.5/dist/dagre.min.js"></script>
-            <script src="https://cdn.jsdelivr.net/npm/cytoscape-dagre@2.5.0/cytoscape-dagre.min.js"></script>
-            <style>
-                * {
-                    margin: 0;
-                    padding: 0;
-                    box-sizing: border-box;
-                }
-                body {
-                    font-family: 'Roboto', 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    min-height: 100vh;
-                    padding: 20px;
-                }
-                .container {
-                    max-width: 1400px;
-                    margin: 0 auto;
-                }
-                header {
-                    background: white;
-                    padding: 30px;
-                    border-radius: 12px;
-                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-                    margin-bottom: 30px;
-                    text-align: center;
-                }
-                h1 {
-                    color: #2c3e50;
-                    font-size: 2.5rem;
-                    margin-bottom: 10px;
-                }
-                .subtitle {
-                    color: #7f8c8d;
-                    font-size: 1.1rem;
-                    margin-top: 10px;
-                }
-                .badge {
-                    display: inline-block;
-                    padding: 6px 12px;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    border-radius: 20px;
-                    font-size: 0.85rem;
-                    font-weight: 500;
-                    margin-left: 10px;
-                }
-                .card-grid {
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-                    gap: 20px;
-                    margin-bottom: 30px;
-                }
-                .card {
-                    background: white;
-                    border-radius: 12px;
-                    padding: 24px;
-                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-                    transition: transform 0.2s, box-shadow 0.2s;
-                }
-                .card:hover {
-                    transform: translateY(-4px);
-                    box-shadow: 0 8px 12px rgba(0,0,0,0.15);
-                }
-                .card-header {
-                    display: flex;
-                    align-items: center;
-                    margin-bottom: 16px;
-                }
-                .card-icon {
-                    width: 48px;
-                    height: 48px;
-                    margin-right: 16px;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    border-radius: 10px;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    flex-shrink: 0;
-                }
-                .card-icon svg {
-                    width: 28px;
-                    height: 28px;
-                    fill: white;
-                }
-                .card-title {
-                    font-size: 1.3rem;
-                    color: #2c3e50;
-                    font-weight: 600;
-                }
-                .card-content {
-                    color: #5a6c7d;
-                    line-height: 1.6;
-                    font-size: 0.95rem;
-                }
-                .endpoint-card {
-                    background: #f8f9fa;
-                    padding: 12px 16px;
-                    border-radius: 8px;
-                    margin: 8px 0;
-                    font-family: 'Courier New', monospace;
-                    font-size: 0.9rem;
-                    border-left: 4px solid #667eea;
-                }
-                .method-badge {
-                    display: inline-block;
-                    padding: 4px 10px;
-                    border-radius: 4px;
-                    font-weight: bold;
-                    font-size: 0.8rem;
-                    margin-right: 8px;
-                }
-                .method-post { background: #e74c3c; color: white; }
-                .method-get { background: #27ae60; color: white; }
-                code {
-                    background: #2c3e50;
-                    color: #ecf0f1;
-                    padding: 3px 8px;
-                    border-radius: 4px;
-                    font-family: 'Courier New', monospace;
-                    font-size: 0.9rem;
-                }
-                .code-block {
-                    background: #2c3e50;
-                    color: #ecf0f1;
-                    padding: 16px;
-                    border-radius: 8px;
-                    overflow-x: auto;
-                    margin: 12px 0;
-                    font-family: 'Courier New', monospace;
-                    font-size: 0.85rem;
-                    line-height: 1.5;
-                }
-                .feature-list {
-                    list-style: none;
-                    padding: 0;
-                }
-                .feature-list li {
-                    padding: 8px 0;
-                    display: flex;
-                    align-items: center;
-                }
-                .feature-list li::before {
-                    content: '✓';
-                    color: #27ae60;
-                    font-weight: bold;
-                    margin-right: 12px;
-                    font-size: 1.2rem;
-                }
-                @media (max-width: 768px) {
-                    h1 { font-size: 1.8rem; }
-                    .card-grid { grid-template-columns: 1fr; }
-                }
-                @media (max-width: 900px) {
-                    .card-content > div[style*="grid-template-columns"] {
-                        grid-template-columns: 1fr !important;
-                    }
-                }
-                #workflowGraph {
-                    width: 100%;
-                    height: 500px;
-                    border: 2px solid #e0e0e0;
-                    border-radius: 8px;
-                    background: #fafafa;
-                }
-                .graph-legend {
-                    display: flex;
-                    flex-wrap: wrap;
-                    gap: 12px;
-                    margin-top: 12px;
-                    padding: 12px;
-                    background: #f8f9fa;
-                    border-radius: 6px;
-                }
-                .legend-item {
-                    display: flex;
-                    align-items: center;
-                    gap: 6px;
-                    font-size: 0.9rem;
-                }
-                .legend-color {
-                    width: 20px;
-                    height: 20px;
-                    border-radius: 4px;
-                    border: 2px solid #333;
-                }
-                .graph-controls {
-                    display: flex;
-                    gap: 8px;
-                    margin-bottom: 12px;
-                    justify-content: flex-end;
-                }
-                .graph-control-btn {
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 6px;
-                    cursor: pointer;
-                    font-weight: 600;
-                    font-size: 0.9rem;
-                    transition: transform 0.2s, box-shadow 0.2s;
-                }
-                .graph-control-btn:hover {
-                    transform: translateY(-2px);
-                    box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-                }
-                .graph-control-btn:active {
-                    transform: translateY(0);
-                }
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <header>
-                    <h1>Instrument Workflow Simulator</h1>
-                    <span class="badge">v1.0.0-phase1a+viz</span>
-                    <p class="subtitle">Discrete-event simulation engine for diagnostic and clinical chemistry instrument workflows</p>
-                </header>
-
-                <div class="card-grid">
-                    <!-- Run Simulation Card - Full Width -->
-                    <div class="card" style="grid-column: 1 / -1;">
-                        <div class="card-header">
-                            <div class="card-icon">
-                                <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 -960 960 960"><path d="M320-200v-560l440 280-440 280Zm80-280Zm0 134 210-134-210-134v268Z"/></svg>
-                            </div>
-                            <h2 class="card-title">Run Simulation</h2>
-                        </div>
-                        <div class="card-content">
-                            <div style="display: grid; grid-template-columns: 1fr 2fr; gap: 20px; margin-bottom: 20px;">
-                                <!-- Left: Controls -->
-                                <div>
-                                    <p style="margin-bottom: 12px;"><strong>Load workflow file:</strong></p>
-                                    <input type="file" id="workflowInput" accept=".json" style="display: none;">
-                                    <button type="button" onclick="document.getElementById('workflowInput').click()" style="
-                                        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                                        color: white;
-                                        border: none;
-                                        padding: 12px 24px;
-                                        border-radius: 8px;
-                                        cursor: pointer;
-                                        font-weight: 600;
-                                        width: 100%;
-                                        margin-bottom: 12px;
-                                    ">Choose Workflow File</button>
-
-                                    <div style="margin-bottom: 16px;">
-                                        <p style="font-size: 0.85rem; color: #7f8c8d; margin-bottom: 8px;">Or load example:</p>
-                                        <select id="exampleSelect" style="
-                                            width: 100%;
-                                            padding: 10px;
-                                            border: 2px solid #e0e0e0;
-                                            border-radius: 6px;
-                                            font-size: 0.95rem;
-                                            margin-bottom: 12px;
-                                        ">
-                                            <option value="">-- Select Example --</option>
-                                            <option value="single_sample_pcr">Single Sample PCR</option>
-                                            <option value="synchronized_batch_analyzer">Batch Analyzer (3 samples)</option>
-                                            <option value="dna_extraction_liquid_handler">DNA Extraction (8 samples)</option>
-                                        </select>
-                                    </div>
-
-                                    <div id="workflowFileName" style="color: #7f8c8d; font-size: 0.9rem; margin-bottom: 16px; min-height: 20px;"></div>
-
-                                    <button id="runSimBtn" onclick="runSimulation()" disabled style="
-                                        background: #27ae60;
-                                        color: white;
-                                        border: none;
-                                        padding: 14px 28px;
-                                        border-radius: 8px;
-                                        cursor: pointer;
-                                        font-weight: 600;
-                                        width: 100%;
-                                        font-size: 1.1rem;
-                                        margin-bottom: 12px;
-                                    ">▶ Run Simulation</button>
-
-                                    <div id="simStatus" style="margin-top: 16px;"></div>
-                                </div>
-
-                                <!-- Right: JSON Editor -->
-                                <div>
-                                    <p style="margin-bottom: 8px;"><strong>Workflow & Scenario JSON:</strong></p>
-                                    <textarea id="jsonEditor" style="
-                                        width: 100%;
-                                        height: 400px;
-                                        font-family: 'Courier New', monospace;
-                                        font-size: 0.85rem;
-                                        padding: 12px;
-                                        border: 2px solid #e0e0e0;
-                                        border-radius: 8px;
-                                        resize: vertical;
-                                        background: #f8f9fa;
-                                    " placeholder="Load a workflow file or select an example..."></textarea>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-
-                    <!-- Workflow Graph Card - Full Width -->
-                    <div class="card" style="grid-column: 1 / -1;">
-                        <div class="card-header">
-                            <div class="card-icon">
-                                <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 -960 960 960"><path d="M240-160q-50 0-85-35t-35-85q0-50 35-85t85-35q14 0 26.5 3t24.5 9l138-138q-6-12-9-24.5t-3-26.5q0-14 3-26.5t9-24.5L291-767q-12 6-24.5 9t-26.5 3q-50 0-85-35t-35-85q0-50 35-85t85-35q50 0 85 35t35 85q0 14-3 26.5t-9 24.5l138 138q12-6 24.5-9t26.5-3q14 0 26.5 3t24.5 9l138-138q-6-12-9-24.5t-3-26.5q0-50 35-85t85-35q50 0 85 35t35 85q0 50-35 85t-85 35q-14 0-26.5-3t-24.5-9L631-567q6 12 9 24.5t3 26.5q0 14-3 26.5t-9 24.5l138 138q12-6 24.5-9t26.5-3q50 0 85 35t35 85q0 50-35 85t-85 35q-50 0-85-35t-35-85q0-14 3-26.5t9-24.5L569-429q-12 6-24.5 9t-26.5 3q-14 0-26.5-3t-24.5-9L329-291q6 12 9 24.5t3 26.5q0 50-35 85t-85 35Zm0-80q17 0 28.5-11.5T280-280q0-17-11.5-28.5T240-320q-17 0-28.5 11.5T200-280q0 17 11.5 28.5T240-240Zm480 0q17 0 28.5-11.5T760-280q0-17-11.5-28.5T720-320q-17 0-28.5 11.5T680-280q0 17 11.5 28.5T720-240ZM240-720q17 0 28.5-11.5T280-760q0-17-11.5-28.5T240-800q-17 0-28.5 11.5T200-760q0 17 11.5 28.5T240-720Zm280 240q17 0 28.5-11.5T560-520q0-17-11.5-28.5T520-560q-17 0-28.5 11.5T480-520q0 17 11.5 28.5T520-480Zm0-40Zm-40 240Zm240 0ZM480-760Z"/></svg>
-                            </div>
-                            <h2 class="card-title">Workflow Graph</h2>
-                        </div>
-                        <div class="card-content">
-                            <div id="graphPlaceholder" style="text-align: center; padding: 100px 20px; color: #7f8c8d;">
-                                <svg xmlns="http://www.w3.org/2000/svg" width="80" height="80" viewBox="0 -960 960 960" style="fill: #bdc3c7; margin-bottom: 20px;"><path d="M240-160q-50 0-85-35t-35-85q0-50 35-85t85-35q14 0 26.5 3t24.5 9l138-138q-6-12-9-24.5t-3-26.5q0-14 3-26.5t9-24.5L291-767q-12 6-24.5 9t-26.5 3q-50 0-85-35t-35-85q0-50 35-85t85-35q50 0 85 35t35 85q0 14-3 26.5t-9 24.5l138 138q12-6 24.5-9t26.5-3q14 0 26.5 3t24.5 9l138-138q-6-12-9-24.5t-3-26.5q0-50 35-85t85-35q50 0 85 35t35 85q0 50-35 85t-85 35q-14 0-26.5-3t-24.5-9L631-567q6 12 9 24.5t3 26.5q0 14-3 26.5t-9 24.5l138 138q12-6 24.5-9t26.5-3q50 0 85 35t35 85q0 50-35 85t-85 35q-50 0-85-35t-35-85q0-14 3-26.5t9-24.5L569-429q-12 6-24.5 9t-26.5 3q-14 0-26.5-3t-24.5-9L329-291q6 12 9 24.5t3 26.5q0 50-35 85t-85 35Z"/></svg>
-                                <p style="font-size: 1.1rem; font-weight: 500;">Load a workflow to see the graph</p>
-                                <p style="font-size: 0.9rem; margin-top: 8px;">The workflow graph shows operations and their dependencies</p>
-                            </div>
-                            <div id="graphControls" class="graph-controls" style="display: none;">
-                                <button class="graph-control-btn" onclick="zoomIn()">🔍+ Zoom In</button>
-                                <button class="graph-control-btn" onclick="zoomOut()">🔍− Zoom Out</button>
-                                <button class="graph-control-btn" onclick="fitGraph()">⊡ Fit to Screen</button>
-                                <button class="graph-control-btn" onclick="resetGraph()">↻ Reset</button>
-                                <span style="margin: 0 12px; color: #7f8c8d;">|</span>
-                                <button class="graph-control-btn" onclick="applyLayout('vertical')">
-                                    <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 24 24" fill="currentColor" style="vertical-align: middle;"><path d="M7 10l5 5 5-5H7z"/></svg>
-                                    Vertical
-                                </button>
-                                <button class="graph-control-btn" onclick="applyLayout('horizontal')">
-                                    <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 24 24" fill="currentColor" style="vertical-align: middle;"><path d="M14 7l-5 5 5 5V7z"/><path d="M3 7h2v10H3z"/></svg>
-                                    Horizontal
-                                </button>
-                                <button class="graph-control-btn" onclick="applyLayout('serpentine')">
-                                    <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 24 24" fill="currentColor" style="vertical-align: middle;"><path d="M3 7h2v10H3zm4 0h2v10H7zm4 0h2v10h-2zm4 0h2v10h-2zm4 0h2v10h-2z"/></svg>
-                                    Serpentine
-                                </button>
-                            </div>
-                            <div id="workflowGraph" style="display: none;"></div>
-                            <div id="graphLegend" class="graph-legend" style="display: none;"></div>
-                        </div>
-                    </div>
-
-            <script>
-                // Combined script - all JavaScript in one block
-                let currentWorkflowData = null;
-
-                // Handle workflow file upload
-                document.getElementById('workflowInput').addEventListener('change', async (e) => {
-                                    const file = e.target.files[0];
-                                    if (!file) return;
-
-                                    document.getElementById('workflowFileName').textContent = `Loaded: ${file.name}`;
-
-                                    const reader = new FileReader();
-                                    reader.onload = (event) => {
-                                        try {
-                                            currentWorkflowData = JSON.parse(event.target.result);
-                                            document.getElementById('jsonEditor').value = JSON.stringify(currentWorkflowData, null, 2);
-                                            document.getElementById('runSimBtn').disabled = false;
-                                            // Render workflow graph
-                                            renderWorkflowGraph(currentWorkflowData);
-                                        } catch (error) {
-                                            document.getElementById('simStatus').innerHTML =
-                                                `<p style="color: #e74c3c;">Error parsing JSON: ${error.message}</p>`;
-                                        }
-                                    };
-                                    reader.readAsText(file);
-                                });
-
-                                // Handle example selection
-                                document.getElementById('exampleSelect').addEventListener('change', async (e) => {
-                                    const example = e.target.value;
-                                    if (!example) return;
-
-                                    document.getElementById('simStatus').innerHTML = '<p style="color: #3498db;">Loading example...</p>';
-
-                                    try {
-                                        const response = await fetch(`/examples/${example}.json`);
-                                        if (!response.ok) throw new Error('Failed to load example');
-
-                                        currentWorkflowData = await response.json();
-                                        document.getElementById('jsonEditor').value = JSON.stringify(currentWorkflowData, null, 2);
-                                        document.getElementById('workflowFileName').textContent = `Loaded: ${example}.json`;
-                                        document.getElementById('runSimBtn').disabled = false;
-                                        document.getElementById('simStatus').innerHTML = '';
-                                        // Render workflow graph
-                                        renderWorkflowGraph(currentWorkflowData);
-                                    } catch (error) {
-                                        document.getElementById('simStatus').innerHTML =
-                                            `<p style="color: #e74c3c;">Error loading example: ${error.message}</p>`;
-                                    }
-                                });
-
-                                // Run simulation
-                                async function runSimulation() {
-                                    const statusDiv = document.getElementById('simStatus');
-                                    const runBtn = document.getElementById('runSimBtn');
-
-                                    // Update JSON from editor in case user edited it
-                                    try {
-                                        currentWorkflowData = JSON.parse(document.getElementById('jsonEditor').value);
-                                    } catch (error) {
-                                        statusDiv.innerHTML = `<p style="color: #e74c3c;">Invalid JSON: ${error.message}</p>`;
-                                        return;
-                                    }
-
-                                    runBtn.disabled = true;
-                                    statusDiv.innerHTML = '<p style="color: #3498db; font-weight: bold;">🔄 Running simulation...</p>';
-
-                                    try {
-                                        const response = await fetch('/api/simulate', {
-                                            method: 'POST',
-                                            headers: { 'Content-Type': 'application/json' },
-                                            body: JSON.stringify(currentWorkflowData)
-                                        });
-
-                                        const data = await response.json();
-
-                                        if (response.ok) {
-                                            statusDiv.innerHTML = `
-                                                <p style="color: #27ae60; font-weight: bold;">✓ Simulation complete!</p>
-                                                <p style="margin-top: 8px;">Run ID: <code>${data.run_id}</code></p>
-                                                <p style="margin-top: 4px;">Events: ${data.event_count} | Samples: ${data.summary.num_samples_completed}</p>
-                                                <p style="margin-top: 4px; color: #7f8c8d;">Opening dashboard...</p>
-                                            `;
-
-                                            // Auto-open dashboard after 1 second
-                                            setTimeout(() => {
-                                                window.open(`/api/simulation/${data.run_id}/visualize/dashboard`, '_blank');
-                                                statusDiv.innerHTML += `
-                                                    <p style="margin-top: 12px;">
-                                                        <a href="/api/simulation/${data.run_id}/visualize/dashboard"
-                                                           target="_blank"
-                                                           style="
-                                                               display: inline-block;
-                                                               padding: 10px 20px;
-                                                               background: #27ae60;
-                                                               color: white;
-                                                               text-decoration: none;
-                                                               border-radius: 6px;
-                                                               font-weight: 600;
-                                                           ">View Dashboard Again</a>
-                                                    </p>
-                                                `;
-                                            }, 1000);
-                                        } else {
-                                            statusDiv.innerHTML = `
-                                                <p style="color: #e74c3c; font-weight: bold;">✗ Simulation failed</p>
-                                                <p style="margin-top: 8px; color: #e74c3c;">${data.error_message || 'Unknown error'}</p>
-                                                ${data.errors ? `<ul style="margin-top: 8px; color: #e74c3c;">${data.errors.map(e => `<li>${e}</li>`).join('')}</ul>` : ''}
-                                            `;
-                                        }
-                                    } catch (error) {
-                                        statusDiv.innerHTML = `<p style="color: #e74c3c;">Request failed: ${error.message}</p>`;
-                                    } finally {
-                                        runBtn.disabled = false;
-                                    }
-                                }
-
-                    <!-- Core API Card -->
-                    <div class="card">
-                        <div class="card-header">
-                            <div class="card-icon">
-                                <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 -960 960 960"><path d="M440-280h80v-160h160v-80H520v-160h-80v160H280v80h160v160Zm40 200q-83 0-156-31.5T197-197q-54-54-85.5-127T80-480q0-83 31.5-156T197-763q54-54 127-85.5T480-880q83 0 156 31.5T763-763q54 54 85.5 127T880-480q0 83-31.5 156T763-197q-54 54-127 85.5T480-80Zm0-80q134 0 227-93t93-227q0-134-93-227t-227-93q-134 0-227 93t-93 227q0 134 93 227t227 93Zm0-320Z"/></svg>
-                            </div>
-                            <h2 class="card-title">Core API</h2>
-                        </div>
-                        <div class="card-content">
-                            <div class="endpoint-card">
-                                <span class="method-badge method-post">POST</span>
-                                <strong>/api/simulate</strong><br>
-                                Execute simulation
-                            </div>
-                            <div class="endpoint-card">
-                                <span class="method-badge method-get">GET</span>
-                                <strong>/api/simulation/{run_id}/events</strong><br>
-                                Retrieve event log
-                            </div>
-                            <div class="endpoint-card">
-                                <span class="method-badge method-get">GET</span>
-                                <strong>/api/simulation/{run_id}/summary</strong><br>
-                                Get summary statistics
-                            </div>
-                            <div class="endpoint-card">
-                                <span class="method-badge method-get">GET</span>
-                                <strong>/api/health</strong><br>
-                                Health check
-                            </div>
-                        </div>
-                    </div>
-
-                    <!-- Visualization Card -->
-                    <div class="card">
-                        <div class="card-header">
-                            <div class="card-icon">
-                                <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 -960 960 960"><path d="M160-160v-640h80v640h-80Zm160 0v-440h80v440h-80Zm160 0v-280h80v280h-80Zm160 0v-640h80v640h-80Zm160 0v-160h80v160h-80Z"/></svg>
-                            </div>
-                            <h2 class="card-title">Visualizations</h2>
-                        </div>
-                        <div class="card-content">
-                            <div class="endpoint-card">
-                                <span class="method-badge method-get">GET</span>
-                                <strong>/visualize/dashboard</strong><br>
-                                Comprehensive dashboard
-                            </div>
-                            <div class="endpoint-card">
-                                <span class="method-badge method-get">GET</span>
-                                <strong>/visualize/gantt</strong><br>
-                                Device operations timeline
-                            </div>
-                            <div class="endpoint-card">
-                                <span class="method-badge method-get">GET</span>
-                                <strong>/visualize/utilization</strong><br>
-                                Device utilization chart
-                            </div>
-                            <div class="endpoint-card">
-                                <span class="method-badge method-get">GET</span>
-                                <strong>/visualize/queue</strong><br>
-                                Queue length timeline
-                            </div>
-                        </div>
-                    </div>
-
-                    <!-- Features Card -->
-                    <div class="card">
-                        <div class="card-header">
-                            <div class="card-icon">
-                                <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 -960 960 960"><path d="m438-240 226-226-58-58-169 169-84-84-57 57 142 142Zm42 160q-83 0-156-31.5T197-197q-54-54-85.5-127T80-480q0-83 31.5-156T197-763q54-54 127-85.5T480-880q83 0 156 31.5T763-763q54 54 85.5 127T880-480q0 83-31.5 156T763-197q-54 54-127 85.5T480-80Zm0-80q134 0 227-93t93-227q0-134-93-227t-227-93q-134 0-227 93t-93 227q0 134 93 227t227 93Zm0-320Z"/></svg>
-                            </div>
-                            <h2 class="card-title">Features</h2>
-                        </div>
-                        <div class="card-content">
-                            <ul class="feature-list">
-                                <li>Discrete-event simulation using SimPy</li>
-                                <li>Resource contention modeling</li>
-                                <li>Three timing distributions</li>
-                                <li>Interactive Plotly visualizations</li>
-                                <li>Device utilization analytics</li>
-                                <li>Bottleneck identification</li>
-                                <li>Event filtering & pagination</li>
-                                <li>94% test coverage</li>
-                            </ul>
-                        </div>
-                    </div>
-
-                    <!-- Example Workflows Card -->
-                    <div class="card">
-                        <div class="card-header">
-                            <div class="card-icon">
-                                <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 -960 960 960"><path d="M320-240h320v-80H320v80Zm0-160h320v-80H320v80ZM240-80q-33 0-56.5-23.5T160-160v-640q0-33 23.5-56.5T240-880h320l240 240v480q0 33-23.5 56.5T720-80H240Zm280-520v-200H240v640h480v-440H520ZM240-800v200-200 640-640Z"/></svg>
-                            </div>
-                            <h2 class="card-title">Examples</h2>
-                        </div>
-                        <div class="card-content">
-                            <p><strong>single_sample_pcr.json</strong></p>
-                            <p style="margin-bottom: 16px;">Simple PCR workflow with 1 sample, 2 devices, 3 operations</p>
-
-                            <p><strong>synchronized_batch_analyzer.json</strong></p>
-                            <p>Chemistry analyzer batch with 3 samples, 3 devices, 6 operations</p>
-                        </div>
-                    </div>
-
-                    <!-- Load Results Card -->
-                    <div class="card">
-                        <div class="card-header">
-                            <div class="card-icon">
-                                <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 -960 960 960"><path d="M440-320v-326L336-542l-56-58 200-200 200 200-56 58-104-104v326h-80ZM240-160q-33 0-56.5-23.5T160-240v-120h80v120h480v-120h80v120q0 33-23.5 56.5T720-160H240Z"/></svg>
-                            </div>
-                            <h2 class="card-title">Load Results</h2>
-                        </div>
-                        <div class="card-content">
-                            <p style="margin-bottom: 16px;">Upload a simulation results JSON file to view visualizations:</p>
-                            <form id="uploadForm" enctype="multipart/form-data" style="margin-bottom: 16px;">
-                                <input type="file" id="fileInput" accept=".json" style="display: none;">
-                                <button type="button" onclick="document.getElementById('fileInput').click()" style="
-                                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                                    color: white;
-                                    border: none;
-                                    padding: 12px 24px;
-                                    border-radius: 8px;
-                                    cursor: pointer;
-                                    font-weight: 600;
-                                    width: 100%;
-                                    font-size: 1rem;
-                                ">Choose File</button>
-                            </form>
-                            <div id="fileName" style="color: #7f8c8d; font-size: 0.9rem; margin-bottom: 12px;"></div>
-                            <div id="uploadStatus"></div>
-                            <script>
-                                const fileInput = document.getElementById('fileInput');
-                                const fileName = document.getElementById('fileName');
-                                const uploadStatus = document.getElementById('uploadStatus');
-
-                                fileInput.addEventListener('change', async (e) => {
-                                    const file = e.target.files[0];
-                                    if (!file) return;
-
-                                    fileName.textContent = `Selected: ${file.name}`;
-                                    uploadStatus.innerHTML = '<p style="color: #3498db;">Uploading...</p>';
-
-                                    const formData = new FormData();
-                                    formData.append('file', file);
-
-                                    try {
-                                        const response = await fetch('/api/upload-results', {
-                                            method: 'POST',
-                                            body: formData
-                                        });
-
-                                        const data = await response.json();
-
-                                        if (response.ok) {
-                                            uploadStatus.innerHTML = `
-                                                <p style="color: #27ae60; font-weight: bold;">✓ Upload successful!</p>
-                                                <p style="margin-top: 8px;">Run ID: <code>${data.run_id}</code></p>
-                                                <a href="/api/simulation/${data.run_id}/visualize/dashboard"
-                                                   target="_blank"
-                                                   style="
-                                                       display: inline-block;
-                                                       margin-top: 12px;
-                                                       padding: 10px 20px;
-                                                       background: #27ae60;
-                                                       color: white;
-                                                       text-decoration: none;
-                                                       border-radius: 6px;
-                                                       font-weight: 600;
-                                                   ">View Dashboard</a>
-                                            `;
-                                        } else {
-                                            uploadStatus.innerHTML = `<p style="color: #e74c3c;">Error: ${data.error_message}</p>`;
-                                        }
-                                    } catch (error) {
-                                        uploadStatus.innerHTML = `<p style="color: #e74c3c;">Upload failed: ${error.message}</p>`;
-                                    }
-                                });
-                            </script>
-                        </div>
-                    </div>
-
-                    <!-- Documentation Card -->
-                    <div class="card">
-                        <div class="card-header">
-                            <div class="card-icon">
-                                <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 -960 960 960"><path d="M240-400h480v-80H240v80Zm0-120h480v-80H240v80Zm0-120h480v-80H240v80ZM80-80v-720q0-33 23.5-56.5T160-880h640q33 0 56.5 23.5T880-800v480q0 33-23.5 56.5T800-240H240L80-80Zm126-240h594v-480H160v525l46-45Zm-46 0v-480 480Z"/></svg>
-                            </div>
-                            <h2 class="card-title">Documentation</h2>
-                        </div>
-                        <div class="card-content">
-                            <p>Comprehensive documentation available in the project repository:</p>
-                            <div class="code-block">https://github.com/pdelmenico/instrument-workflow-sim</div>
-                            <p style="margin-top: 12px;">See <code>README.md</code> for detailed usage instructions, API reference, and examples.</p>
-                        </div>
-                    </div>
-                </div>
-            </div>
-
-                // Workflow graph visualization (continuing combined script block)
-                let cy = null;
-                let initialZoom = null;
-                let initialPan = null;
-                const deviceColors = {};
-                const colorPalette = [
-                    '#667eea', '#764ba2', '#f093fb', '#4facfe',
-                    '#43e97b', '#fa709a', '#fee140', '#30cfd0',
-                    '#a8edea', '#fed6e3', '#c471ed', '#12c2e9'
-                ];
-                let colorIndex = 0;
-
-                function getDeviceColor(deviceId) {
-                    if (!deviceColors[deviceId]) {
-                        deviceColors[deviceId] = colorPalette[colorIndex % colorPalette.length];
-                        colorIndex++;
-                    }
-                    return deviceColors[deviceId];
-                }
-
-                function parseWorkflowToCytoscape(workflowData) {
-                    if (!workflowData.workflow || !workflowData.workflow.operations) {
-                        return { elements: [], devices: {} };
-                    }
-
-                    const workflow = workflowData.workflow;
-                    const elements = [];
-                    const devices = {};
-
-                    // Create a map of operations
-                    const operationMap = {};
-                    workflow.operations.forEach(op => {
-                        operationMap[op.operation_id] = op;
-                        if (!devices[op.device_id]) {
-                            devices[op.device_id] = workflow.devices.find(d => d.device_id === op.device_id);
-                        }
-                    });
-
-                    // Create nodes for each operation
-                    workflow.operations.forEach(op => {
-                        let timingStr = '';
-                        if (op.timing.type === 'fixed') {
-                            timingStr = `Fixed: ${op.timing.value}s`;
-                        } else if (op.timing.type === 'triangular') {
-                            timingStr = `Tri: ${op.timing.min}-${op.timing.max}s`;
-                        } else if (op.timing.type === 'exponential') {
-                            timingStr = `Exp: μ=${op.timing.mean}s`;
-                        }
-
-                        elements.push({
-                            data: {
-                                id: op.operation_id,
-                                label: op.operation_name || op.operation_id,
-                                device: op.device_id,
-                                timing: timingStr,
-                                opType: op.operation_type || 'processing'
-                            }
-                        });
-                    });
-
-                    // Create edges based on base_sequence predecessors
-                    if (workflow.base_sequence) {
-                        workflow.base_sequence.forEach(step => {
-                            if (step.predecessors && step.predecessors.length > 0) {
-                                step.predecessors.forEach(predId => {
-                                    elements.push({
-                                        data: {
-                                            id: `${predId}-${step.operation_id}`,
-                                            source: predId,
-                                            target: step.operation_id
-                                        }
-                                    });
-                                });
-                            }
-                        });
-                    }
-
-                    return { elements, devices };
-                }
-
-                function renderWorkflowGraph(workflowData) {
-                    // Store workflow data for layout functions
-                    currentWorkflowData = workflowData;
-
-                    const { elements, devices } = parseWorkflowToCytoscape(workflowData);
-
-                    if (elements.length === 0) {
-                        document.getElementById('graphPlaceholder').style.display = 'block';
-                        document.getElementById('graphControls').style.display = 'none';
-                        document.getElementById('workflowGraph').style.display = 'none';
-                        document.getElementById('graphLegend').style.display = 'none';
-                        return;
-                    }
-
-                    // Hide placeholder, show graph and controls
-                    document.getElementById('graphPlaceholder').style.display = 'none';
-                    document.getElementById('graphControls').style.display = 'flex';
-                    document.getElementById('workflowGraph').style.display = 'block';
-                    document.getElementById('graphLegend').style.display = 'flex';
-
-                    // Reset color assignments
-                    Object.keys(deviceColors).forEach(key => delete deviceColors[key]);
-                    colorIndex = 0;
-
-                    // Initialize cytoscape
-                    if (cy) {
-                        cy.destroy();
-                    }
-
-                    cy = cytoscape({
-                        container: document.getElementById('workflowGraph'),
-                        elements: elements,
-                        minZoom: 0.3,
-                        maxZoom: 3,
-                        wheelSensitivity: 0.2,
-                        userZoomingEnabled: true,
-                        userPanningEnabled: true,
-                        boxSelectionEnabled: false,
-                        style: [
-                            {
-                                selector: 'node',
-                                style: {
-                                    'label': 'data(label)',
-                                    'text-valign': 'center',
-                                    'text-halign': 'center',
-                                    'background-color': function(ele) {
-                                        return getDeviceColor(ele.data('device'));
-                                    },
-                                    'shape': 'roundrectangle',
-                                    'width': '180',
-                                    'height': '80',
-                                    'border-width': 3,
-                                    'border-color': '#333',
-                                    'color': '#fff',
-                                    'font-size': '14px',
-                                    'font-weight': 'bold',
-                                    'text-wrap': 'wrap',
-                                    'text-max-width': '160px'
-                                }
-                            },
-                            {
-                                selector: 'edge',
-                                style: {
-                                    'width': 3,
-                                    'line-color': '#95a5a6',
-                                    'target-arrow-color': '#95a5a6',
-                                    'target-arrow-shape': 'triangle',
-                                    'curve-style': 'bezier',
-                                    'arrow-scale': 1.5
-                                }
-                            }
-                        ],
-                        layout: {
-                            name: 'dagre',
-                            rankDir: 'TB',  // Always start with TB (works reliably)
-                            nodeSep: 50,
-                            rankSep: 80,
-                            padding: 30
-                        },
-                        // Add explicit pan boundaries to prevent issues with LR layout
-                        panningEnabled: true,
-                        userPanningEnabled: true,
-                        autoungrabify: false,
-                        autounselectify: false
-                    });
-
-                    // Add tooltips
-                    cy.on('mouseover', 'node', function(evt) {
-                        const node = evt.target;
-                        const data = node.data();
-                        node.style({
-                            'border-width': 5,
-                            'border-color': '#000'
-                        });
-
-                        // Could add a proper tooltip here
-                        console.log(`${data.label}\nDevice: ${data.device}\nTiming: ${data.timing}\nType: ${data.opType}`);
-                    });
-
-                    cy.on('mouseout', 'node', function(evt) {
-                        evt.target.style({
-                            'border-width': 3,
-                            'border-color': '#333'
-                        });
-                    });
-
-                    // Enforce zoom limits more aggressively
-                    // Store the last valid zoom/pan state
-                    let lastValidZoom = cy.zoom();
-                    let lastValidPan = cy.pan();
-                    let isAdjustingZoom = false;
-
-                    cy.on('zoom', function(evt) {
-                        if (isAdjustingZoom) return;
-
-                        const currentZoom = cy.zoom();
-                        const MIN_ZOOM = 0.3;
-                        const MAX_ZOOM = 3;
-
-                        if (currentZoom > MAX_ZOOM || currentZoom < MIN_ZOOM) {
-                            isAdjustingZoom = true;
-
-                            // Clamp to limits
-                            const clampedZoom = Math.max(MIN_ZOOM, Math.min(MAX_ZOOM, currentZoom));
-
-                            // Restore to last valid state immediately
-                            cy.viewport({
-                                zoom: clampedZoom,
-                                pan: lastValidPan
-                            });
-
-                            // Force redraw
-                            cy.resize();
-                            cy.forceRender();
-
-                            isAdjustingZoom = false;
-                        } else {
-                            // Update last valid state
-                            lastValidZoom = currentZoom;
-                            lastValidPan = cy.pan();
-                        }
-                    });
-
-                    // Add pan constraints to handle LR layout issues
-                    cy.on('pan', function() {
-                        const pan = cy.pan();
-                        const zoom = cy.zoom();
-                        const extent = cy.extent();
-
-                        // Calculate valid pan boundaries based on graph extent
-                        const w = cy.width();
-                        const h = cy.height();
-                        const graphWidth = (extent.x2 - extent.x1) * zoom;
-                        const graphHeight = (extent.y2 - extent.y1) * zoom;
-
-                        // Allow some margin but prevent going too far off-screen
-                        const maxPanX = w / 2;
-                        const minPanX = w / 2 - graphWidth;
-                        const maxPanY = h / 2;
-                        const minPanY = h / 2 - graphHeight;
-
-                        let newPan = { ...pan };
-                        let needsAdjust = false;
-
-                        if (pan.x > maxPanX) {
-                            newPan.x = maxPanX;
-                            needsAdjust = true;
-                        } else if (pan.x < minPanX) {
-                            newPan.x = minPanX;
-                            needsAdjust = true;
-                        }
-
-                        if (pan.y > maxPanY) {
-                            newPan.y = maxPanY;
-                            needsAdjust = true;
-                        } else if (pan.y < minPanY) {
-                            newPan.y = minPanY;
-                            needsAdjust = true;
-                        }
-
-                        if (needsAdjust) {
-                            cy.pan(newPan);
-                        }
-                    });
-
-                    // Build legend
-                    const legendDiv = document.getElementById('graphLegend');
-                    legendDiv.innerHTML = '<strong style="width: 100%; margin-bottom: 4px;">Devices:</strong>';
-
-                    Object.entries(devices).forEach(([deviceId, device]) => {
-                        const color = getDeviceColor(deviceId);
-                        const item = document.createElement('div');
-                        item.className = 'legend-item';
-                        item.innerHTML = `
-                            <div class="legend-color" style="background-color: ${color};"></div>
-                            <span><strong>${device.device_name || deviceId}</strong> (capacity: ${device.resource_capacity})</span>
-                        `;
-                        legendDiv.appendChild(item);
-                    });
-
-                    // Set explicit starting zoom level for consistency
-                    setTimeout(() => {
-                        const DEFAULT_ZOOM = 0.5; // Safe starting zoom for all workflows
-                        const MIN_ZOOM = 0.3;
-                        const MAX_ZOOM = 3;
-
-                        // Always start at default zoom level
-                        cy.zoom({
-                            level: DEFAULT_ZOOM,
-                            renderedPosition: { x: cy.width() / 2, y: cy.height() / 2 }
-                        });
-                        cy.center();
-
-                        initialZoom = cy.zoom();
-                        initialPan = { ...cy.pan() };
-                    }, 100);
-                }
-
-                // Zoom control functions
-                function zoomIn() {
-                    if (cy) {
-                        const currentZoom = cy.zoom();
-                        const newZoom = Math.min(currentZoom * 1.2, 3); // Max zoom 3x
-                        cy.zoom({
-                            level: newZoom,
-                            renderedPosition: { x: cy.width() / 2, y: cy.height() / 2 }
-                        });
-                    }
-                }
-
-                function zoomOut() {
-                    if (cy) {
-                        const currentZoom = cy.zoom();
-                        const newZoom = Math.max(currentZoom * 0.8, 0.3); // Min zoom 0.3x
-                        cy.zoom({
-                            level: newZoom,
-                            renderedPosition: { x: cy.width() / 2, y: cy.height() / 2 }
-                        });
-                    }
-                }
-
-                function fitGraph() {
-                    if (cy) {
-                        cy.fit(null, 30); // 30px padding
-                        // Ensure fit respects minimum zoom
-                        setTimeout(() => {
-                            const currentZoom = cy.zoom();
-                            if (currentZoom < 0.3) {
-                                cy.zoom({
-                                    level: 0.3,
-                                    renderedPosition: { x: cy.width() / 2, y: cy.height() / 2 }
-                                });
-                                cy.center();
-                            }
-                            // Update initial state to current fitted state
-                            initialZoom = cy.zoom();
-                            initialPan = { ...cy.pan() };
-                        }, 50);
-                    }
-                }
-
-                function resetGraph() {
-                    if (cy) {
-                        if (initialZoom && initialPan) {
-                            // Restore to initial state
-                            cy.zoom(initialZoom);
-                            cy.pan(initialPan);
-                        } else {
-                            // Fallback to fit
-                            cy.fit(null, 30);
-                            cy.center();
-                        }
-                    }
-                }
-
-                // Layout customization functions
-                function applyLayout(layoutType) {
-                    if (!cy || !currentWorkflowData) return;
-
-                    const nodesPerRow = 6; // Configurable nodes per row for horizontal/serpentine
-
-                    if (layoutType === 'vertical') {
-                        // Reapply TB dagre layout
-                        cy.layout({
-                            name: 'dagre',
-                            rankDir: 'TB',
-                            nodeSep: 50,
-                            rankSep: 80,
-                            padding: 30
-                        }).run();
-
-                    } else if (layoutType === 'horizontal') {
-                        // Manual horizontal layout in rows
-                        // Create order map from workflow base_sequence
-                        const sequenceOrder = {};
-                        currentWorkflowData.workflow.base_sequence.forEach((step, index) => {
-                            sequenceOrder[step.operation_id] = index;
-                        });
-
-                        const nodes = cy.nodes().sort((a, b) => {
-                            // Sort by workflow sequence order
-                            const orderA = sequenceOrder[a.id()] !== undefined ? sequenceOrder[a.id()] : 999;
-                            const orderB = sequenceOrder[b.id()] !== undefined ? sequenceOrder[b.id()] : 999;
-                            return orderA - orderB;
-                        });
-
-                        const nodeWidth = 200;
-                        const nodeHeight = 100;
-                        const horizontalSpacing = 80;
-                        const verticalSpacing = 120;
-
-                        nodes.forEach((node, index) => {
-                            const row = Math.floor(index / nodesPerRow);
-                            const col = index % nodesPerRow;
-
-                            node.position({
-                                x: col * (nodeWidth + horizontalSpacing),
-                                y: row * (nodeHeight + verticalSpacing)
-                            });
-                        });
-
-                    } else if (layoutType === 'serpentine') {
-                        // Serpentine/boustrophedon layout (zig-zag)
-                        // Create order map from workflow base_sequence
-                        const sequenceOrder = {};
-                        currentWorkflowData.workflow.base_sequence.forEach((step, index) => {
-                            sequenceOrder[step.operation_id] = index;
-                        });
-
-                        const nodes = cy.nodes().sort((a, b) => {
-                            // Sort by workflow sequence order
-                            const orderA = sequenceOrder[a.id()] !== undefined ? sequenceOrder[a.id()] : 999;
-                            const orderB = sequenceOrder[b.id()] !== undefined ? sequenceOrder[b.id()] : 999;
-                            return orderA - orderB;
-                        });
-
-                        const nodeWidth = 200;
-                        const nodeHeight = 100;
-                        const horizontalSpacing = 80;
-                        const verticalSpacing = 120;
-
-                        nodes.forEach((node, index) => {
-                            const row = Math.floor(index / nodesPerRow);
-                            const colIndex = index % nodesPerRow;
-
-                            // Alternate direction on odd rows
-                            const col = (row % 2 === 0) ? colIndex : (nodesPerRow - 1 - colIndex);
-
-                            node.position({
-                                x: col * (nodeWidth + horizontalSpacing),
-                                y: row * (nodeHeight + verticalSpacing)
-                            });
-                        });
-                    }
-
-                    // Fit and reset zoom after layout change
-                    setTimeout(() => {
-                        fitGraph();
-                    }, 100);
-                }
-            </script>
-        </body>
-        </html>
-        """
-        return render_template_string(html)
+    app.add_url_rule('/static/<filename>', view_func=serve_asset)
+    app.add_url_rule('/api/examples', view_func=list_examples)
+    app.add_url_rule('/', endpoint='index', view_func=index)
+
+    # Example files are answered before Flask's routing
+    app.wsgi_app = ExampleFilesMiddleware(app.wsgi_app)
 
     return app
 
 
 if __name__ == '__main__':
+    # Logging is process-wide, so it is configured by the entry point rather
+    # than by every create_app() call
+    configure_logging()
     app = create_app()
-    app.run(host='0.0.0.0', port=5001, debug=True)
+    # The debugger and reloader add per-request overhead; opt in explicitly
+    debug = os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true')
+    app.run(host='0.0.0.0', port=5001, debug=debug)
@@ -5,10 +5,12 @@ Usage:
     python save_simulation.py <run_id> [output_file]
 
 Example:
-    python save_simulation.py sim_run_20251126_145121_9da46a results.json
+    python save_simulation.py sim_run_187b4c3e9a2f1d00_9da46a1c results.json
 """
 import sys
-import json
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 import requests
 from pathlib import Path
 
@@ -28,22 +30,43 @@ def save_simulation_results(run_id: str, output_file: str = None):
     print(f"Fetching simulation results for {run_id}...")
 
     try:
-        # Get events
-        events_response = requests.get(f"{base_url}/simulation/{run_id}/events?limit=100000")
-        events_response.raise_for_status()
-        events_data = events_response.json()
-
-        # Get summary
-        summary_response = requests.get(f"{base_url}/simulation/{run_id}/summary")
-        summary_response.raise_for_status()
-        summary_data = summary_response.json()
+        # The two requests are independent, so they run concurrently. Each
+        # gets its own session, since sessions are not guaranteed to be
+        # thread-safe
+        with (
+            requests.Session() as events_session,
+            requests.Session() as summary_session,
+            ThreadPoolExecutor(max_workers=2) as executor
+        ):
+            # Events come back as NDJSON so they can be decoded line by line
+            # while the page is still streaming in
+            events_future = executor.submit(
+                events_session.get,
+                f"{base_url}/simulation/{run_id}/events?limit=100000&format=ndjson",
+                stream=True
+            )
+            summary_future = executor.submit(summary_session.get, f"{base_url}/simulation/{run_id}/summary")
+
+            # Get events
+            events_response = events_future.result()
+            events_response.raise_for_status()
+            events = [
+                orjson.loads(line)
+                for line in events_response.iter_lines(chunk_size=65536)
+                if line
+            ]
+
+            # Get summary
+            summary_response = summary_future.result()
+            summary_response.raise_for_status()
+            summary_data = orjson.loads(summary_response.content)
 
         # Combine into single JSON structure
         results = {
             "run_id": run_id,
             "workflow": {},  # Would need to be fetched separately if needed
             "scenario": {},  # Would need to be fetched separately if needed
-            "events": events_data['events'],
+            "events": events,
             "summary": summary_data['summary'],
             "execution_time": 0.0,  # Not available from API
             "timestamp": "",  # Not available from API
@@ -51,14 +74,13 @@ def save_simulation_results(run_id: str, output_file: str = None):
 
         # Save to file
         output_path = Path(output_file)
-        with open(output_path, 'w') as f:
-            json.dump(results, f, indent=2)
+        output_path.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
         print(f"✓ Simulation results saved to: {output_path.absolute()}")
         print(f"\nYou can now upload this file through the web interface at:")
         print(f"  http://localhost:5001/")
         print(f"\nOr use curl:")
-        print(f"  curl -X POST http://localhost:5001/api/upload-results -F 'file=@{output_file}'")
+        print(f"  curl -X POST http://localhost:5001/api/upload-results -H 'Content-Type: application/json' --data-binary '@{output_file}'")
 
     except requests.exceptions.ConnectionError:
         print("✗ Error: Could not connect to API server")
@@ -78,7 +100,7 @@ if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python save_simulation.py <run_id> [output_file]")
         print("\nExample:")
-        print("  python save_simulation.py sim_run_20251126_145121_9da46a results.json")
+        print("  python save_simulation.py sim_run_187b4c3e9a2f1d00_9da46a1c results.json")
         sys.exit(1)
 
     run_id = sys.argv[1]
@@ -6,14 +6,14 @@ setup(
     version="0.1.0",
     description="Discrete-event simulation for diagnostic instrument workflows",
     author="Systems Engineering Team",
-    python_requires=">=3.9",
+    python_requires=">=3.10",
     packages=find_packages(),
     install_requires=[
         "simpy>=4.0.1",
         "numpy>=1.21.0",
         "pandas>=1.3.0",
-        "flask>=2.0.0",
-        "flask-cors>=3.0.10",
+        "flask>=2.2.0",
+        "orjson>=3.6.0",
         "jsonschema>=4.0",
     ],
     extras_require={
@@ -29,7 +29,6 @@ setup(
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Science/Research",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],
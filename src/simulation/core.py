@@ -1,6 +1,9 @@
 """Core simulation engine using SimPy for discrete-event simulation."""
 import logging
-from typing import Dict, List, Tuple, Any
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Deque, Dict, List, Optional, Tuple, Any, Union
 import simpy
 import numpy as np
 
@@ -17,6 +20,82 @@ from src.simulation.timing import sample_timing, set_random_seed
 logger = logging.getLogger(__name__)
 
 
+class _SlotRequest(simpy.Event):
+    """Usage request for a :class:`_SingleSlotResource`.
+
+    Like a SimPy resource request, it is released with
+    :meth:`_SingleSlotResource.release` or used as
+    ``with resource.request() as req: yield req``; leaving the block
+    releases the slot, or withdraws the request if it was never granted.
+    """
+
+    __slots__ = ('resource',)
+
+    def __init__(self, resource: "_SingleSlotResource") -> None:
+        super().__init__(resource.env)
+        self.resource = resource
+        resource.queue.append(self)
+        resource._grant()
+
+    def __enter__(self) -> "_SlotRequest":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if not self.triggered:
+            self.resource.queue.remove(self)
+        if exc_type is not GeneratorExit:
+            self.resource.release(self)
+
+
+class _SingleSlotResource:
+    """FIFO resource with a single usage slot.
+
+    Stands in for ``simpy.Resource(env, capacity=1)`` without the generic
+    put/get queue machinery. Requests are granted in exactly the same
+    order and at the same simulation steps as with ``simpy.Resource``, so
+    seeded runs give identical results.
+
+    Attributes:
+        env: SimPy environment the resource belongs to
+        capacity: Number of usage slots (always 1)
+        queue: Pending requests, oldest first
+        user: Request currently holding the slot, if any
+    """
+
+    capacity = 1
+
+    def __init__(self, env: simpy.Environment) -> None:
+        self.env = env
+        self.queue: Deque[_SlotRequest] = deque()
+        self.user: Optional[_SlotRequest] = None
+
+    def request(self) -> _SlotRequest:
+        """Request the slot; the returned event fires once it is granted."""
+        return _SlotRequest(self)
+
+    def release(self, request: _SlotRequest) -> None:
+        """Free the slot held by a request.
+
+        As with ``simpy.Resource``, the next request is granted when the
+        release event is processed rather than immediately.
+        """
+        if self.user is request:
+            self.user = None
+        released = simpy.Event(self.env)
+        released.callbacks.append(self._grant)
+        released.succeed()
+
+    def _grant(self, event: Optional[simpy.Event] = None) -> None:
+        """Hand the free slot to the oldest pending request."""
+        if self.user is None and self.queue:
+            self.user = self.queue.popleft()
+            self.user.succeed()
+
+
+# Resource types a device can be backed by
+DeviceResource = Union[simpy.Resource, _SingleSlotResource]
+
+
 class SimulationEngine:
     """Orchestrates discrete-event simulation using SimPy.
 
@@ -29,14 +108,23 @@ class SimulationEngine:
         env: SimPy environment for discrete-event simulation
         resources: Dictionary mapping device_id to SimPy Resource
         event_log: List of all simulation events
+        record_events: Whether events are recorded in event_log
     """
 
-    def __init__(self, workflow: Dict[str, Any], scenario: Dict[str, Any]) -> None:
+    def __init__(
+        self,
+        workflow: Dict[str, Any],
+        scenario: Dict[str, Any],
+        record_events: bool = True
+    ) -> None:
         """Initialize simulation engine.
 
         Args:
             workflow: Validated workflow JSON definition
             scenario: Validated scenario configuration
+            record_events: If False, skip building the event log and only
+                compute summary statistics; run() then returns an empty
+                event list (default: True)
 
         Example:
             >>> engine = SimulationEngine(workflow, scenario)
@@ -45,31 +133,91 @@ class SimulationEngine:
         self.workflow = workflow
         self.scenario = scenario
         self.env = simpy.Environment()
-        self.resources: Dict[str, simpy.Resource] = {}
+        self.resources: Dict[str, DeviceResource] = {}
         self.event_log: List[SimulationEvent] = []
-
-        # Track sample completion times for cycle time calculation
-        self._sample_start_times: Dict[str, float] = {}
-        self._sample_end_times: Dict[str, float] = {}
+        self.record_events = record_events
+
+        # Base sequence steps resolved to their operation and device resource
+        self._resolved_sequence: List[Tuple[str, Dict[str, Any], str, DeviceResource]] = []
+
+        # Sample start and completion times indexed by sample position,
+        # allocated in run(); NaN marks samples that have not started or
+        # completed, so cycle times are a single array subtraction
+        self._sample_start_times: np.ndarray = np.empty(0)
+        self._sample_end_times: np.ndarray = np.empty(0)
+
+        # Per-device and per-operation statistics, accumulated as the
+        # simulation runs so the summary does not need to scan the event log.
+        # Wait times only include samples that actually waited.
+        self._device_busy_time: Dict[str, float] = {}
+        self._device_max_queue: Dict[str, int] = {}
+        self._device_wait_times: Dict[str, List[float]] = {}
+        self._operation_durations: Dict[str, List[float]] = {}
+        self._operation_wait_times: Dict[str, List[float]] = {}
 
     def initialize_resources(self) -> None:
         """Create SimPy Resource for each device in workflow.
 
         Each device becomes a SimPy Resource with capacity specified
         in the workflow definition. This enables automatic queuing
-        and resource contention modeling.
+        and resource contention modeling. Single-capacity devices use the
+        lighter :class:`_SingleSlotResource`. Also sets up the per-device and
+        per-operation statistics accumulated during the run.
         """
         for device in self.workflow['devices']:
             device_id = device['device_id']
             capacity = device['resource_capacity']
 
-            self.resources[device_id] = simpy.Resource(
-                self.env,
-                capacity=capacity
-            )
+            if capacity == 1:
+                self.resources[device_id] = _SingleSlotResource(self.env)
+            else:
+                self.resources[device_id] = simpy.Resource(
+                    self.env,
+                    capacity=capacity
+                )
+            self._device_busy_time[device_id] = 0.0
+            self._device_max_queue[device_id] = 0
+            self._device_wait_times[device_id] = []
 
             logger.debug(f"Initialized resource '{device_id}' with capacity {capacity}")
 
+        for operation in self.workflow['operations']:
+            self._operation_durations[operation['operation_id']] = []
+            self._operation_wait_times[operation['operation_id']] = []
+
+    def _resolve_sequence(self) -> List[Tuple[str, Dict[str, Any], str, DeviceResource]]:
+        """Resolve each base sequence step to its operation and device resource.
+
+        Done once per run, so sample processes do not search the operation
+        list at every step.
+
+        Returns:
+            List of (operation_id, operation definition, device_id, device
+            resource) tuples in sequence order
+
+        Raises:
+            ValueError: If a step references an operation not in the workflow
+        """
+        # First definition wins for duplicate IDs, as with a linear search
+        operations: Dict[str, Dict[str, Any]] = {}
+        for op in self.workflow['operations']:
+            operations.setdefault(op['operation_id'], op)
+
+        resolved = []
+        for step in self.workflow['base_sequence']:
+            operation_id = step['operation_id']
+            op_def = operations.get(operation_id)
+
+            if not op_def:
+                raise ValueError(
+                    f"Operation '{operation_id}' not found in workflow definition"
+                )
+
+            device_id = op_def['device_id']
+            resolved.append((operation_id, op_def, device_id, self.resources[device_id]))
+
+        return resolved
+
     def _compute_entry_times(self) -> List[Tuple[str, float]]:
         """Compute sample entry times based on entry pattern.
 
@@ -97,7 +245,7 @@ class SimulationEngine:
                 f"Supported types: synchronized, single"
             )
 
-    def _sample_process(self, sample_id: str, entry_time: float):
+    def _sample_process(self, sample_index: int, sample_id: str, entry_time: float):
         """Generator function for a single sample's workflow execution.
 
         This coroutine is executed by SimPy and models one sample flowing
@@ -105,107 +253,109 @@ class SimulationEngine:
         other samples.
 
         Args:
+            sample_index: Position of this sample in the entry order
             sample_id: Unique identifier for this sample
             entry_time: Simulation time when sample enters system
 
         Yields:
             SimPy events (timeouts and resource requests)
         """
+        env = self.env
+        timeout = env.timeout
+        # Events go straight into the shared log so it stays in timeline
+        # order; positional construction skips keyword argument matching
+        log_event = self.event_log.append
+        make_event = SimulationEvent
+        record_events = self.record_events
+        device_busy_time = self._device_busy_time
+        device_max_queue = self._device_max_queue
+        device_wait_times = self._device_wait_times
+        operation_durations = self._operation_durations
+        operation_wait_times = self._operation_wait_times
+        # Checked once per sample so debug messages are only formatted when
+        # they will be emitted
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
         # Wait until entry time
         if entry_time > 0:
-            yield self.env.timeout(entry_time)
+            yield timeout(entry_time)
 
-        # Record sample start time
-        self._sample_start_times[sample_id] = self.env.now
+        # Record sample start time; the clock only advances across a yield,
+        # so ``now`` is re-read once after each one
+        now = env.now
+        self._sample_start_times[sample_index] = now
 
-        logger.debug(f"{sample_id} entered system at t={self.env.now}")
+        if debug_enabled:
+            logger.debug(f"{sample_id} entered system at t={now}")
 
         # Process each operation in sequence
-        for step in self.workflow['base_sequence']:
-            operation_id = step['operation_id']
-
-            # Find operation definition
-            op_def = next(
-                (op for op in self.workflow['operations']
-                 if op['operation_id'] == operation_id),
-                None
-            )
-
-            if not op_def:
-                raise ValueError(
-                    f"Operation '{operation_id}' not found in workflow definition"
-                )
-
-            device_id = op_def['device_id']
-            device_resource = self.resources[device_id]
-
+        for operation_id, op_def, device_id, device_resource in self._resolved_sequence:
             # Record QUEUED event (before requesting resource)
             queue_len = len(device_resource.queue)
-            self.event_log.append(SimulationEvent(
-                timestamp=self.env.now,
-                event_type="QUEUED",
-                sample_id=sample_id,
-                operation_id=operation_id,
-                device_id=device_id,
-                duration=0.0,
-                wait_time=0.0,
-                device_queue_length=queue_len,
-                notes=""
-            ))
-
-            # Request device resource
-            queue_start_time = self.env.now
-            with device_resource.request() as req:
-                yield req
-
-                # Calculate wait time
-                wait_time = self.env.now - queue_start_time
-
-                # Record START event
-                self.event_log.append(SimulationEvent(
-                    timestamp=self.env.now,
-                    event_type="START",
-                    sample_id=sample_id,
-                    operation_id=operation_id,
-                    device_id=device_id,
-                    duration=0.0,
-                    wait_time=wait_time,
-                    device_queue_length=0,
-                    notes=""
+            if record_events:
+                log_event(make_event(
+                    now, "QUEUED", sample_id, operation_id, device_id,
+                    0.0, 0.0, queue_len, ""
                 ))
+            if queue_len > device_max_queue[device_id]:
+                device_max_queue[device_id] = queue_len
+
+            # Request device resource. Released explicitly rather than through
+            # the request's context manager: errors abort the whole run, and
+            # like the context manager the slot is not released when a
+            # cut-off sample's generator is closed, so no try/finally is needed
+            queue_start_time = now
+            req = device_resource.request()
+            yield req
+            now = env.now
+
+            # Calculate wait time
+            wait_time = now - queue_start_time
+
+            # Record START event
+            if record_events:
+                log_event(make_event(
+                    now, "START", sample_id, operation_id, device_id,
+                    0.0, wait_time, 0, ""
+                ))
+            if wait_time > 0:
+                device_wait_times[device_id].append(wait_time)
+                operation_wait_times[operation_id].append(wait_time)
 
+            if debug_enabled:
                 logger.debug(
                     f"{sample_id} started '{operation_id}' on '{device_id}' "
-                    f"at t={self.env.now} (waited {wait_time:.2f}s)"
+                    f"at t={now} (waited {wait_time:.2f}s)"
                 )
 
-                # Sample operation duration
-                duration = sample_timing(op_def['timing'])
-
-                # Execute operation (wait for duration)
-                yield self.env.timeout(duration)
-
-                # Record COMPLETE event
-                self.event_log.append(SimulationEvent(
-                    timestamp=self.env.now,
-                    event_type="COMPLETE",
-                    sample_id=sample_id,
-                    operation_id=operation_id,
-                    device_id=device_id,
-                    duration=duration,
-                    wait_time=wait_time,
-                    device_queue_length=0,
-                    notes=""
+            # Sample operation duration
+            duration = sample_timing(op_def['timing'])
+
+            # Execute operation (wait for duration)
+            yield timeout(duration)
+            now = env.now
+
+            # Record COMPLETE event
+            if record_events:
+                log_event(make_event(
+                    now, "COMPLETE", sample_id, operation_id, device_id,
+                    duration, wait_time, 0, ""
                 ))
+            device_busy_time[device_id] += duration
+            operation_durations[operation_id].append(duration)
 
+            if debug_enabled:
                 logger.debug(
                     f"{sample_id} completed '{operation_id}' on '{device_id}' "
-                    f"at t={self.env.now} (duration {duration:.2f}s)"
+                    f"at t={now} (duration {duration:.2f}s)"
                 )
 
+            # Release device resource
+            device_resource.release(req)
+
         # Record sample end time
-        self._sample_end_times[sample_id] = self.env.now
-        logger.info(f"{sample_id} completed workflow at t={self.env.now}")
+        self._sample_end_times[sample_index] = now
+        logger.info(f"{sample_id} completed workflow at t={now}")
 
     def run(self) -> Tuple[List[SimulationEvent], SimulationSummary]:
         """Execute simulation and return event log and summary statistics.
@@ -213,7 +363,7 @@ class SimulationEngine:
         This is the main entry point for running a simulation. It orchestrates
         the entire simulation lifecycle:
         1. Set random seed (if provided)
-        2. Initialize resources
+        2. Initialize resources and resolve the workflow sequence
         3. Compute sample entry times
         4. Start sample processes
         5. Run SimPy simulation
@@ -221,7 +371,8 @@ class SimulationEngine:
 
         Returns:
             Tuple of (event_log, summary):
-                - event_log: List of all simulation events
+                - event_log: List of all simulation events (empty when
+                  record_events is False)
                 - summary: SimulationSummary with statistics
 
         Example:
@@ -238,13 +389,17 @@ class SimulationEngine:
 
         # Initialize resources
         self.initialize_resources()
+        self._resolved_sequence = self._resolve_sequence()
 
         # Compute sample entry times
         entry_times = self._compute_entry_times()
 
+        self._sample_start_times = np.full(len(entry_times), np.nan)
+        self._sample_end_times = np.full(len(entry_times), np.nan)
+
         # Start sample process for each sample
-        for sample_id, entry_time in entry_times:
-            self.env.process(self._sample_process(sample_id, entry_time))
+        for sample_index, (sample_id, entry_time) in enumerate(entry_times):
+            self.env.process(self._sample_process(sample_index, sample_id, entry_time))
 
         # Run simulation
         max_time = sim_config.get('max_simulation_time')
@@ -266,7 +421,7 @@ class SimulationEngine:
         return self.event_log, summary
 
     def _compute_summary(self) -> SimulationSummary:
-        """Compute summary statistics from event log.
+        """Compute summary statistics from the values accumulated during the run.
 
         Computes comprehensive statistics including:
         - Device utilization (fraction of time device was busy)
@@ -279,32 +434,30 @@ class SimulationEngine:
             SimulationSummary with complete statistics
         """
         total_time = self.env.now
-        num_completed = len(self._sample_end_times)
+        # Calculate sample cycle times; a completed sample always has a start
+        # time, so the end times alone select the completed samples
+        completed = ~np.isnan(self._sample_end_times)
+        cycle_times = self._sample_end_times[completed] - self._sample_start_times[completed]
+        num_completed = cycle_times.size
         num_failed = 0
 
-        # Calculate sample cycle times
-        cycle_times = []
-        for sample_id in self._sample_end_times:
-            if sample_id in self._sample_start_times:
-                cycle_time = self._sample_end_times[sample_id] - self._sample_start_times[sample_id]
-                cycle_times.append(cycle_time)
-
-        mean_cycle_time = np.mean(cycle_times) if cycle_times else 0.0
-        min_cycle_time = np.min(cycle_times) if cycle_times else 0.0
-        max_cycle_time = np.max(cycle_times) if cycle_times else 0.0
+        mean_cycle_time = float(cycle_times.mean()) if cycle_times.size else 0.0
+        min_cycle_time = float(cycle_times.min()) if cycle_times.size else 0.0
+        max_cycle_time = float(cycle_times.max()) if cycle_times.size else 0.0
 
         throughput = num_completed / total_time if total_time > 0 else 0.0
 
+        device_ids = [device['device_id'] for device in self.workflow['devices']]
+        operation_ids = [operation['operation_id'] for operation in self.workflow['operations']]
+
         # Compute device utilization
         device_utilization = {}
         for device in self.workflow['devices']:
             device_id = device['device_id']
             capacity = device['resource_capacity']
 
-            # Sum up all COMPLETE event durations for this device
-            device_events = [e for e in self.event_log
-                           if e.device_id == device_id and e.event_type == "COMPLETE"]
-            total_busy_time = sum(e.duration for e in device_events)
+            # Durations of all completed operations on this device
+            total_busy_time = self._device_busy_time[device_id]
 
             # Utilization is total busy time divided by (capacity × total time)
             # This gives utilization as a fraction between 0 and 1
@@ -314,26 +467,14 @@ class SimulationEngine:
 
         # Compute queue statistics per device
         device_queue_stats = {}
-        for device in self.workflow['devices']:
-            device_id = device['device_id']
-
-            # Get all QUEUED events for this device
-            queued_events = [e for e in self.event_log
-                           if e.device_id == device_id and e.event_type == "QUEUED"]
-
-            # Get all START events with wait times for this device
-            start_events = [e for e in self.event_log
-                          if e.device_id == device_id and e.event_type == "START"]
-
-            max_queue_length = max((e.device_queue_length for e in queued_events), default=0)
-
-            wait_times = [e.wait_time for e in start_events if e.wait_time > 0]
+        for device_id in device_ids:
+            wait_times = self._device_wait_times[device_id]
             avg_queue_time = np.mean(wait_times) if wait_times else 0.0
             total_queue_time = sum(wait_times)
             queue_events = len(wait_times)
 
             device_queue_stats[device_id] = DeviceQueueStats(
-                max_queue_length=max_queue_length,
+                max_queue_length=self._device_max_queue[device_id],
                 avg_queue_time=avg_queue_time,
                 total_queue_time=total_queue_time,
                 queue_events=queue_events
@@ -341,37 +482,26 @@ class SimulationEngine:
 
         # Compute operation statistics
         operation_stats = {}
-        for operation in self.workflow['operations']:
-            op_id = operation['operation_id']
-
-            # Get all COMPLETE events for this operation
-            complete_events = [e for e in self.event_log
-                             if e.operation_id == op_id and e.event_type == "COMPLETE"]
+        for op_id in operation_ids:
+            # Converted to an array once rather than by each reduction
+            durations = np.array(self._operation_durations[op_id])
 
-            durations = [e.duration for e in complete_events]
-
-            if durations:
+            if durations.size:
                 operation_stats[op_id] = OperationStats(
-                    mean_duration=float(np.mean(durations)),
-                    stdev_duration=float(np.std(durations)),
-                    min_duration=float(np.min(durations)),
-                    max_duration=float(np.max(durations)),
+                    mean_duration=float(durations.mean()),
+                    stdev_duration=float(durations.std()),
+                    min_duration=float(durations.min()),
+                    max_duration=float(durations.max()),
                     median_duration=float(np.median(durations)),
-                    sample_count=len(durations)
+                    sample_count=int(durations.size)
                 )
             else:
                 operation_stats[op_id] = OperationStats()
 
         # Compute operation wait time statistics
         operation_wait_times = {}
-        for operation in self.workflow['operations']:
-            op_id = operation['operation_id']
-
-            # Get all START events for this operation
-            start_events = [e for e in self.event_log
-                          if e.operation_id == op_id and e.event_type == "START"]
-
-            wait_times = [e.wait_time for e in start_events if e.wait_time > 0]
+        for op_id in operation_ids:
+            wait_times = self._operation_wait_times[op_id]
 
             mean_wait = float(np.mean(wait_times)) if wait_times else 0.0
             total_wait = sum(wait_times)
@@ -416,3 +546,43 @@ class SimulationEngine:
         )
 
         return summary
+
+
+def _run_job(
+    job: Tuple[Dict[str, Any], Dict[str, Any]],
+    record_events: bool = True
+) -> Tuple[List[SimulationEvent], SimulationSummary]:
+    """Run one (workflow, scenario) job; module-level so it can be pickled."""
+    workflow, scenario = job
+    return SimulationEngine(workflow, scenario, record_events).run()
+
+
+def run_batch(
+    jobs: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+    max_workers: Optional[int] = None,
+    record_events: bool = True
+) -> List[Tuple[List[SimulationEvent], SimulationSummary]]:
+    """Run independent simulations in parallel worker processes.
+
+    A single SimPy simulation runs on one core, so parameter sweeps and
+    replicate runs are spread across processes instead, one engine per job.
+    Jobs whose scenario sets ``random_seed`` give the same results as
+    running them one after another.
+
+    Args:
+        jobs: (workflow, scenario) pairs, each already validated
+        max_workers: Number of worker processes (default: CPU count)
+        record_events: If False, only summaries are computed and every
+            returned event log is empty, which keeps sweeps light on memory
+            and on transfer back from the workers (default: True)
+
+    Returns:
+        List of (event_log, summary) tuples, in the same order as jobs
+
+    Example:
+        >>> jobs = [(workflow, {**scenario, 'simulation_config': {'random_seed': seed}})
+        ...         for seed in range(10)]
+        >>> results = run_batch(jobs)
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(partial(_run_job, record_events=record_events), jobs))
@@ -1,12 +1,43 @@
 """Data models for simulation events and summary statistics."""
-from dataclasses import dataclass, field
-from typing import Dict, Optional
+import sys
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Optional
 
 
-@dataclass
+def _intern(value: Any) -> Any:
+    """Intern ``value`` if it is a string, returning other values unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> FrozenSet[str]:
+    """Return the names of a dataclass's fields."""
+    return frozenset(f.name for f in fields(cls))
+
+
+def _reject_unknown_fields(cls: type, data: Dict[str, Any]) -> None:
+    """Reject dictionary keys that are not fields of ``cls``.
+
+    Keeps ``from_dict`` as strict as keyword construction with ``**data``,
+    so malformed uploads are still rejected.
+
+    Raises:
+        TypeError: If data contains keys that are not fields of cls
+    """
+    names = _field_names(cls)
+    if not data.keys() <= names:
+        unknown = ', '.join(sorted(data.keys() - names))
+        raise TypeError(f"{cls.__name__} got unexpected fields: {unknown}")
+
+
+@dataclass(slots=True)
 class SimulationEvent:
     """Represents a single event in the simulation timeline.
 
+    Declared with ``slots=True`` since simulations produce thousands of
+    events; slotted instances carry no per-instance ``__dict__``.
+
     Attributes:
         timestamp: Simulation clock time in seconds
         event_type: Type of event (QUEUED, START, COMPLETE, RELEASED)
@@ -45,8 +76,41 @@ class SimulationEvent:
         if self.device_queue_length < 0:
             raise ValueError(f"device_queue_length must be non-negative, got {self.device_queue_length}")
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SimulationEvent":
+        """Create an event from a dictionary in the serialized event format.
 
-@dataclass
+        Passes fields positionally rather than unpacking ``**data``, which
+        matters when loading large uploaded event logs. The identifier fields
+        repeat across thousands of events, so they are interned to share one
+        string object per distinct value instead of one copy per event.
+
+        Args:
+            data: Event dictionary
+
+        Returns:
+            SimulationEvent instance
+
+        Raises:
+            KeyError: If a required field is missing
+            TypeError: If data contains unknown fields
+            ValueError: If field values are invalid
+        """
+        _reject_unknown_fields(cls, data)
+        return cls(
+            data["timestamp"],
+            _intern(data["event_type"]),
+            _intern(data["sample_id"]),
+            _intern(data["operation_id"]),
+            _intern(data["device_id"]),
+            data["duration"],
+            data["wait_time"],
+            data["device_queue_length"],
+            data.get("notes", "")
+        )
+
+
+@dataclass(slots=True)
 class DeviceQueueStats:
     """Statistics for device queue behavior.
 
@@ -61,8 +125,35 @@ class DeviceQueueStats:
     total_queue_time: float = 0.0
     queue_events: int = 0
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DeviceQueueStats":
+        """Create queue statistics from a dictionary produced by :meth:`to_dict`.
 
-@dataclass
+        Missing fields take their default values, as with keyword
+        construction.
+
+        Raises:
+            TypeError: If data contains unknown fields
+        """
+        _reject_unknown_fields(cls, data)
+        return cls(
+            data.get("max_queue_length", 0),
+            data.get("avg_queue_time", 0.0),
+            data.get("total_queue_time", 0.0),
+            data.get("queue_events", 0)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert queue statistics to a JSON-serializable dictionary."""
+        return {
+            "max_queue_length": self.max_queue_length,
+            "avg_queue_time": self.avg_queue_time,
+            "total_queue_time": self.total_queue_time,
+            "queue_events": self.queue_events
+        }
+
+
+@dataclass(slots=True)
 class OperationStats:
     """Statistics for operation execution.
 
@@ -81,8 +172,39 @@ class OperationStats:
     median_duration: float = 0.0
     sample_count: int = 0
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OperationStats":
+        """Create operation statistics from a dictionary produced by :meth:`to_dict`.
 
-@dataclass
+        Missing fields take their default values, as with keyword
+        construction.
+
+        Raises:
+            TypeError: If data contains unknown fields
+        """
+        _reject_unknown_fields(cls, data)
+        return cls(
+            data.get("mean_duration", 0.0),
+            data.get("stdev_duration", 0.0),
+            data.get("min_duration", 0.0),
+            data.get("max_duration", 0.0),
+            data.get("median_duration", 0.0),
+            data.get("sample_count", 0)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert operation statistics to a JSON-serializable dictionary."""
+        return {
+            "mean_duration": self.mean_duration,
+            "stdev_duration": self.stdev_duration,
+            "min_duration": self.min_duration,
+            "max_duration": self.max_duration,
+            "median_duration": self.median_duration,
+            "sample_count": self.sample_count
+        }
+
+
+@dataclass(slots=True)
 class OperationWaitStats:
     """Statistics for operation wait times.
 
@@ -95,8 +217,33 @@ class OperationWaitStats:
     total_wait: float = 0.0
     wait_events: int = 0
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OperationWaitStats":
+        """Create wait statistics from a dictionary produced by :meth:`to_dict`.
 
-@dataclass
+        Missing fields take their default values, as with keyword
+        construction.
+
+        Raises:
+            TypeError: If data contains unknown fields
+        """
+        _reject_unknown_fields(cls, data)
+        return cls(
+            data.get("mean_wait", 0.0),
+            data.get("total_wait", 0.0),
+            data.get("wait_events", 0)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert wait statistics to a JSON-serializable dictionary."""
+        return {
+            "mean_wait": self.mean_wait,
+            "total_wait": self.total_wait,
+            "wait_events": self.wait_events
+        }
+
+
+@dataclass(slots=True)
 class SimulationSummary:
     """Summary statistics from a completed simulation.
 
@@ -150,6 +297,38 @@ class SimulationSummary:
             if not 0.0 <= util <= 1.0:
                 raise ValueError(f"device_utilization for {device_id} must be between 0.0 and 1.0, got {util}")
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert summary, including nested statistics, to a JSON-serializable dictionary.
+
+        Builds the dictionary directly rather than via ``dataclasses.asdict``,
+        which deep-copies every nested value on each call.
+        """
+        return {
+            "total_simulation_time": self.total_simulation_time,
+            "num_samples_completed": self.num_samples_completed,
+            "num_samples_failed": self.num_samples_failed,
+            "device_utilization": dict(self.device_utilization),
+            "device_queue_stats": {
+                device_id: stats.to_dict()
+                for device_id, stats in self.device_queue_stats.items()
+            },
+            "operation_stats": {
+                op_id: stats.to_dict()
+                for op_id, stats in self.operation_stats.items()
+            },
+            "operation_wait_times": {
+                op_id: stats.to_dict()
+                for op_id, stats in self.operation_wait_times.items()
+            },
+            "total_throughput": self.total_throughput,
+            "mean_sample_cycle_time": self.mean_sample_cycle_time,
+            "min_sample_cycle_time": self.min_sample_cycle_time,
+            "max_sample_cycle_time": self.max_sample_cycle_time,
+            "bottleneck_device": self.bottleneck_device,
+            "bottleneck_utilization": self.bottleneck_utilization,
+            "bottleneck_queue_delay": self.bottleneck_queue_delay
+        }
+
 
 @dataclass
 class ValidationResult:
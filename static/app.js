@@ -0,0 +1,701 @@
+// Run simulation card
+let currentWorkflowData = null;
+
+// Handle workflow file upload
+document.getElementById('workflowInput').addEventListener('change', async (e) => {
+    const file = e.target.files[0];
+    if (!file) return;
+
+    document.getElementById('workflowFileName').textContent = `Loaded: ${file.name}`;
+
+    const reader = new FileReader();
+    reader.onload = (event) => {
+        try {
+            currentWorkflowData = JSON.parse(event.target.result);
+            document.getElementById('jsonEditor').value = JSON.stringify(currentWorkflowData, null, 2);
+            document.getElementById('runSimBtn').disabled = false;
+            // Render workflow graph
+            renderWorkflowGraph(currentWorkflowData);
+        } catch (error) {
+            document.getElementById('simStatus').innerHTML =
+                `<p style="color: #e74c3c;">Error parsing JSON: ${error.message}</p>`;
+        }
+    };
+    reader.readAsText(file);
+});
+
+// Handle example selection
+// All examples arrive in one request, started when the dropdown is first used
+let examplesPromise = null;
+
+function loadExamples() {
+    if (!examplesPromise) {
+        examplesPromise = fetch('/api/examples').then(response => {
+            if (!response.ok) throw new Error('Failed to load examples');
+            return response.json();
+        });
+        // Allow a retry after a failed request
+        examplesPromise.catch(() => { examplesPromise = null; });
+    }
+    return examplesPromise;
+}
+
+// Picking an example is the first step towards drawing a graph, so the graph
+// libraries are also warmed up while the browser is idle
+document.getElementById('exampleSelect').addEventListener('focus', () => {
+    loadExamples();
+    preloadGraphLibraries();
+}, { once: true });
+
+document.getElementById('exampleSelect').addEventListener('change', async (e) => {
+    const example = e.target.value;
+    if (!example) return;
+
+    document.getElementById('simStatus').innerHTML = '<p style="color: #3498db;">Loading example...</p>';
+
+    try {
+        const examples = await loadExamples();
+        if (!examples[example]) throw new Error('Failed to load example');
+
+        currentWorkflowData = examples[example];
+        document.getElementById('jsonEditor').value = JSON.stringify(currentWorkflowData, null, 2);
+        document.getElementById('workflowFileName').textContent = `Loaded: ${example}.json`;
+        document.getElementById('runSimBtn').disabled = false;
+        document.getElementById('simStatus').innerHTML = '';
+        // Render workflow graph
+        renderWorkflowGraph(currentWorkflowData);
+    } catch (error) {
+        document.getElementById('simStatus').innerHTML =
+            `<p style="color: #e74c3c;">Error loading example: ${error.message}</p>`;
+    }
+});
+
+// Run simulation
+async function runSimulation() {
+    const statusDiv = document.getElementById('simStatus');
+    const runBtn = document.getElementById('runSimBtn');
+
+    // Update JSON from editor in case user edited it
+    try {
+        currentWorkflowData = JSON.parse(document.getElementById('jsonEditor').value);
+    } catch (error) {
+        statusDiv.innerHTML = `<p style="color: #e74c3c;">Invalid JSON: ${error.message}</p>`;
+        return;
+    }
+
+    runBtn.disabled = true;
+    statusDiv.innerHTML = '<p style="color: #3498db; font-weight: bold;">🔄 Running simulation...</p>';
+
+    try {
+        const response = await fetch('/api/simulate', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(currentWorkflowData)
+        });
+
+        const data = await response.json();
+
+        if (response.ok) {
+            statusDiv.innerHTML = `
+                <p style="color: #27ae60; font-weight: bold;">✓ Simulation complete!</p>
+                <p style="margin-top: 8px;">Run ID: <code>${data.run_id}</code></p>
+                <p style="margin-top: 4px;">Events: ${data.event_count} | Samples: ${data.summary.num_samples_completed}</p>
+                <p style="margin-top: 4px; color: #7f8c8d;">Opening dashboard...</p>
+            `;
+
+            // Auto-open dashboard after 1 second
+            setTimeout(() => {
+                window.open(`/api/simulation/${data.run_id}/visualize/dashboard`, '_blank');
+                statusDiv.innerHTML += `
+                    <p style="margin-top: 12px;">
+                        <a href="/api/simulation/${data.run_id}/visualize/dashboard"
+                           target="_blank"
+                           style="
+                               display: inline-block;
+                               padding: 10px 20px;
+                               background: #27ae60;
+                               color: white;
+                               text-decoration: none;
+                               border-radius: 6px;
+                               font-weight: 600;
+                           ">View Dashboard Again</a>
+                    </p>
+                `;
+            }, 1000);
+        } else {
+            statusDiv.innerHTML = `
+                <p style="color: #e74c3c; font-weight: bold;">✗ Simulation failed</p>
+                <p style="margin-top: 8px; color: #e74c3c;">${data.error_message || 'Unknown error'}</p>
+                ${data.errors ? `<ul style="margin-top: 8px; color: #e74c3c;">${data.errors.map(e => `<li>${e}</li>`).join('')}</ul>` : ''}
+            `;
+        }
+    } catch (error) {
+        statusDiv.innerHTML = `<p style="color: #e74c3c;">Request failed: ${error.message}</p>`;
+    } finally {
+        runBtn.disabled = false;
+    }
+}
+
+// Load results card
+const fileInput = document.getElementById('fileInput');
+const fileName = document.getElementById('fileName');
+const uploadStatus = document.getElementById('uploadStatus');
+
+fileInput.addEventListener('change', async (e) => {
+    const file = e.target.files[0];
+    if (!file) return;
+
+    fileName.textContent = `Selected: ${file.name}`;
+    uploadStatus.innerHTML = '<p style="color: #3498db;">Uploading...</p>';
+
+    try {
+        // The file is already JSON, so it is sent as the request body as-is,
+        // gzip-compressed where the browser supports CompressionStream
+        const headers = { 'Content-Type': 'application/json' };
+        let body = file;
+        if ('CompressionStream' in window) {
+            body = await new Response(file.stream().pipeThrough(new CompressionStream('gzip'))).blob();
+            headers['Content-Encoding'] = 'gzip';
+        }
+
+        const response = await fetch('/api/upload-results', {
+            method: 'POST',
+            headers,
+            body
+        });
+
+        const data = await response.json();
+
+        if (response.ok) {
+            uploadStatus.innerHTML = `
+                <p style="color: #27ae60; font-weight: bold;">✓ Upload successful!</p>
+                <p style="margin-top: 8px;">Run ID: <code>${data.run_id}</code></p>
+                <a href="/api/simulation/${data.run_id}/visualize/dashboard"
+                   target="_blank"
+                   style="
+                       display: inline-block;
+                       margin-top: 12px;
+                       padding: 10px 20px;
+                       background: #27ae60;
+                       color: white;
+                       text-decoration: none;
+                       border-radius: 6px;
+                       font-weight: 600;
+                   ">View Dashboard</a>
+            `;
+        } else {
+            uploadStatus.innerHTML = `<p style="color: #e74c3c;">Error: ${data.error_message}</p>`;
+        }
+    } catch (error) {
+        uploadStatus.innerHTML = `<p style="color: #e74c3c;">Upload failed: ${error.message}</p>`;
+    }
+});
+
+// Workflow graph visualization
+let cy = null;
+let initialZoom = null;
+let initialPan = null;
+const colorPalette = [
+    '#667eea', '#764ba2', '#f093fb', '#4facfe',
+    '#43e97b', '#fa709a', '#fee140', '#30cfd0',
+    '#a8edea', '#fed6e3', '#c471ed', '#12c2e9'
+];
+
+// Stylesheet and initial layout shared by every rendered workflow graph
+const GRAPH_STYLE = [
+    {
+        selector: 'node',
+        style: {
+            'label': 'data(label)',
+            'text-valign': 'center',
+            'text-halign': 'center',
+            'background-color': 'data(color)',
+            'shape': 'roundrectangle',
+            'width': '180',
+            'height': '80',
+            'border-width': 3,
+            'border-color': '#333',
+            'color': '#fff',
+            'font-size': '14px',
+            'font-weight': 'bold',
+            'text-wrap': 'wrap',
+            'text-max-width': '160px'
+        }
+    },
+    {
+        selector: 'node.hovered',
+        style: {
+            'border-width': 5,
+            'border-color': '#000'
+        }
+    },
+    {
+        selector: 'edge',
+        style: {
+            'width': 3,
+            'line-color': '#95a5a6',
+            'target-arrow-color': '#95a5a6',
+            'target-arrow-shape': 'triangle',
+            'curve-style': 'bezier',
+            'arrow-scale': 1.5
+        }
+    }
+];
+
+const GRAPH_LAYOUT = {
+    name: 'dagre',
+    rankDir: 'TB',  // Always start with TB (works reliably)
+    nodeSep: 50,
+    rankSep: 80,
+    padding: 30
+};
+
+// The graph libraries are only needed once a workflow is loaded, so
+// they are fetched on first use rather than blocking page load
+const CYTOSCAPE_URL = 'https://cdnjs.cloudflare.com/ajax/libs/cytoscape/3.28.1/cytoscape.min.js';
+const DAGRE_URL = 'https://cdn.jsdelivr.net/npm/dagre@0.8.5/dist/dagre.min.js';
+const CYTOSCAPE_DAGRE_URL = 'https://cdn.jsdelivr.net/npm/cytoscape-dagre@2.5.0/cytoscape-dagre.min.js';
+let graphLibrariesPromise = null;
+
+function loadScript(src) {
+    return new Promise((resolve, reject) => {
+        const script = document.createElement('script');
+        script.src = src;
+        script.onload = resolve;
+        script.onerror = () => reject(new Error(`Failed to load ${src}`));
+        document.head.appendChild(script);
+    });
+}
+
+function preloadGraphLibraries() {
+    const preload = () => loadGraphLibraries().catch(() => {});
+    if ('requestIdleCallback' in window) {
+        requestIdleCallback(preload);
+    } else {
+        setTimeout(preload, 0);
+    }
+}
+
+function whenVisible(element) {
+    return new Promise(resolve => {
+        const observer = new IntersectionObserver(entries => {
+            if (entries.some(entry => entry.isIntersecting)) {
+                observer.disconnect();
+                resolve();
+            }
+        });
+        observer.observe(element);
+    });
+}
+
+function loadGraphLibraries() {
+    if (!graphLibrariesPromise) {
+        // cytoscape-dagre registers itself with the cytoscape and dagre
+        // globals, so it loads after both
+        graphLibrariesPromise = Promise.all([loadScript(CYTOSCAPE_URL), loadScript(DAGRE_URL)])
+            .then(() => loadScript(CYTOSCAPE_DAGRE_URL));
+        // Allow a retry if the CDN was unreachable
+        graphLibrariesPromise.catch(() => { graphLibrariesPromise = null; });
+    }
+    return graphLibrariesPromise;
+}
+
+// Parsed graphs keyed by workflow object, so re-rendering the same workflow
+// (e.g. picking an example again) skips parsing; entries go with the object
+const parsedWorkflows = new WeakMap();
+
+function parseWorkflowToCytoscape(workflowData) {
+    if (!workflowData.workflow || !workflowData.workflow.operations) {
+        return { elements: [], devices: {}, deviceColors: {} };
+    }
+
+    const workflow = workflowData.workflow;
+    if (parsedWorkflows.has(workflow)) {
+        return parsedWorkflows.get(workflow);
+    }
+
+    const elements = [];
+    const devices = {};
+    const deviceColors = {};
+    let colorIndex = 0;
+    const deviceById = new Map(workflow.devices.map(d => [d.device_id, d]));
+
+    // Collect the devices used by operations, assigning palette colors in
+    // order of first use
+    workflow.operations.forEach(op => {
+        if (!devices[op.device_id]) {
+            devices[op.device_id] = deviceById.get(op.device_id);
+            deviceColors[op.device_id] = colorPalette[colorIndex % colorPalette.length];
+            colorIndex++;
+        }
+    });
+
+    // Create nodes for each operation
+    workflow.operations.forEach(op => {
+        let timingStr = '';
+        if (op.timing.type === 'fixed') {
+            timingStr = `Fixed: ${op.timing.value}s`;
+        } else if (op.timing.type === 'triangular') {
+            timingStr = `Tri: ${op.timing.min}-${op.timing.max}s`;
+        } else if (op.timing.type === 'exponential') {
+            timingStr = `Exp: μ=${op.timing.mean}s`;
+        }
+
+        elements.push({
+            data: {
+                id: op.operation_id,
+                label: op.operation_name || op.operation_id,
+                device: op.device_id,
+                color: deviceColors[op.device_id],
+                timing: timingStr,
+                opType: op.operation_type || 'processing'
+            }
+        });
+    });
+
+    // Create edges based on base_sequence predecessors
+    const edges = (workflow.base_sequence || []).flatMap(step =>
+        (step.predecessors || []).map(predId => ({
+            data: {
+                id: `${predId}-${step.operation_id}`,
+                source: predId,
+                target: step.operation_id
+            }
+        }))
+    );
+
+    const parsed = { elements: elements.concat(edges), devices, deviceColors };
+    parsedWorkflows.set(workflow, parsed);
+    return parsed;
+}
+
+// Graph event handlers are bound once, when the Cytoscape instance is created
+function bindGraphEvents() {
+    // Highlight hovered nodes; the class is styled in the graph stylesheet
+    cy.on('mouseover', 'node', function(evt) {
+        evt.target.addClass('hovered');
+    });
+
+    cy.on('mouseout', 'node', function(evt) {
+        evt.target.removeClass('hovered');
+    });
+
+    // Enforce zoom limits more aggressively
+    // Store the last valid zoom/pan state
+    let lastValidZoom = cy.zoom();
+    let lastValidPan = cy.pan();
+    let isAdjustingZoom = false;
+
+    cy.on('zoom', function(evt) {
+        if (isAdjustingZoom) return;
+
+        const currentZoom = cy.zoom();
+        const MIN_ZOOM = 0.3;
+        const MAX_ZOOM = 3;
+
+        if (currentZoom > MAX_ZOOM || currentZoom < MIN_ZOOM) {
+            isAdjustingZoom = true;
+
+            // Clamp to limits
+            const clampedZoom = Math.max(MIN_ZOOM, Math.min(MAX_ZOOM, currentZoom));
+
+            // Restore to last valid state immediately
+            cy.viewport({
+                zoom: clampedZoom,
+                pan: lastValidPan
+            });
+
+            // Force redraw
+            cy.resize();
+            cy.forceRender();
+
+            isAdjustingZoom = false;
+        } else {
+            // Update last valid state
+            lastValidZoom = currentZoom;
+            lastValidPan = cy.pan();
+        }
+    });
+
+    // Add pan constraints to handle LR layout issues
+    cy.on('pan', function() {
+        const pan = cy.pan();
+        const zoom = cy.zoom();
+        const extent = cy.extent();
+
+        // Calculate valid pan boundaries based on graph extent
+        const w = cy.width();
+        const h = cy.height();
+        const graphWidth = (extent.x2 - extent.x1) * zoom;
+        const graphHeight = (extent.y2 - extent.y1) * zoom;
+
+        // Allow some margin but prevent going too far off-screen
+        const maxPanX = w / 2;
+        const minPanX = w / 2 - graphWidth;
+        const maxPanY = h / 2;
+        const minPanY = h / 2 - graphHeight;
+
+        let newPan = { ...pan };
+        let needsAdjust = false;
+
+        if (pan.x > maxPanX) {
+            newPan.x = maxPanX;
+            needsAdjust = true;
+        } else if (pan.x < minPanX) {
+            newPan.x = minPanX;
+            needsAdjust = true;
+        }
+
+        if (pan.y > maxPanY) {
+            newPan.y = maxPanY;
+            needsAdjust = true;
+        } else if (pan.y < minPanY) {
+            newPan.y = minPanY;
+            needsAdjust = true;
+        }
+
+        if (needsAdjust) {
+            cy.pan(newPan);
+        }
+    });
+}
+
+async function renderWorkflowGraph(workflowData) {
+    // Store workflow data for layout functions
+    currentWorkflowData = workflowData;
+
+    const { elements, devices, deviceColors } = parseWorkflowToCytoscape(workflowData);
+
+    if (elements.length === 0) {
+        document.getElementById('graphPlaceholder').style.display = 'block';
+        document.getElementById('graphControls').style.display = 'none';
+        document.getElementById('workflowGraph').style.display = 'none';
+        document.getElementById('graphLegend').style.display = 'none';
+        return;
+    }
+
+    // Build the graph only once its card is on screen; the libraries load
+    // in the meantime
+    try {
+        await Promise.all([
+            loadGraphLibraries(),
+            whenVisible(document.getElementById('workflowGraph').parentElement)
+        ]);
+    } catch (error) {
+        console.error(error);
+        return;
+    }
+    // A newer workflow may have been loaded while waiting
+    if (currentWorkflowData !== workflowData) {
+        return;
+    }
+
+    // Hide placeholder, show graph and controls
+    document.getElementById('graphPlaceholder').style.display = 'none';
+    document.getElementById('graphControls').style.display = 'flex';
+    document.getElementById('workflowGraph').style.display = 'block';
+    document.getElementById('graphLegend').style.display = 'flex';
+
+    if (cy) {
+        // Swap the elements on the existing instance in one batch so styles
+        // are recomputed once, then lay out the new graph
+        cy.resize();
+        cy.batch(() => {
+            cy.elements().remove();
+            cy.add(elements);
+        });
+        cy.layout(GRAPH_LAYOUT).run();
+    } else {
+        // Initialize cytoscape
+        cy = cytoscape({
+            container: document.getElementById('workflowGraph'),
+            elements: elements,
+            minZoom: 0.3,
+            maxZoom: 3,
+            wheelSensitivity: 0.2,
+            userZoomingEnabled: true,
+            userPanningEnabled: true,
+            boxSelectionEnabled: false,
+            style: GRAPH_STYLE,
+            layout: GRAPH_LAYOUT,
+            // Add explicit pan boundaries to prevent issues with LR layout
+            panningEnabled: true,
+            userPanningEnabled: true,
+            autoungrabify: false,
+            autounselectify: false
+        });
+        bindGraphEvents();
+    }
+
+    // Build legend
+    const legendDiv = document.getElementById('graphLegend');
+    legendDiv.innerHTML = '<strong style="width: 100%; margin-bottom: 4px;">Devices:</strong>';
+
+    // Items are assembled off-document and inserted in one go
+    const legendItems = document.createDocumentFragment();
+    Object.entries(devices).forEach(([deviceId, device]) => {
+        const color = deviceColors[deviceId];
+        const item = document.createElement('div');
+        item.className = 'legend-item';
+        item.innerHTML = `
+            <div class="legend-color" style="background-color: ${color};"></div>
+            <span><strong>${device.device_name || deviceId}</strong> (capacity: ${device.resource_capacity})</span>
+        `;
+        legendItems.appendChild(item);
+    });
+    legendDiv.appendChild(legendItems);
+
+    // Set explicit starting zoom level for consistency
+    setTimeout(() => {
+        const DEFAULT_ZOOM = 0.5; // Safe starting zoom for all workflows
+        const MIN_ZOOM = 0.3;
+        const MAX_ZOOM = 3;
+
+        // Always start at default zoom level
+        cy.zoom({
+            level: DEFAULT_ZOOM,
+            renderedPosition: { x: cy.width() / 2, y: cy.height() / 2 }
+        });
+        cy.center();
+
+        initialZoom = cy.zoom();
+        initialPan = { ...cy.pan() };
+    }, 100);
+}
+
+// Zoom control functions
+function zoomIn() {
+    if (cy) {
+        const currentZoom = cy.zoom();
+        const newZoom = Math.min(currentZoom * 1.2, 3); // Max zoom 3x
+        cy.zoom({
+            level: newZoom,
+            renderedPosition: { x: cy.width() / 2, y: cy.height() / 2 }
+        });
+    }
+}
+
+function zoomOut() {
+    if (cy) {
+        const currentZoom = cy.zoom();
+        const newZoom = Math.max(currentZoom * 0.8, 0.3); // Min zoom 0.3x
+        cy.zoom({
+            level: newZoom,
+            renderedPosition: { x: cy.width() / 2, y: cy.height() / 2 }
+        });
+    }
+}
+
+function fitGraph() {
+    if (cy) {
+        cy.fit(null, 30); // 30px padding
+        // Ensure fit respects minimum zoom
+        setTimeout(() => {
+            const currentZoom = cy.zoom();
+            if (currentZoom < 0.3) {
+                cy.zoom({
+                    level: 0.3,
+                    renderedPosition: { x: cy.width() / 2, y: cy.height() / 2 }
+                });
+                cy.center();
+            }
+            // Update initial state to current fitted state
+            initialZoom = cy.zoom();
+            initialPan = { ...cy.pan() };
+        }, 50);
+    }
+}
+
+function resetGraph() {
+    if (cy) {
+        if (initialZoom && initialPan) {
+            // Restore to initial state
+            cy.zoom(initialZoom);
+            cy.pan(initialPan);
+        } else {
+            // Fallback to fit
+            cy.fit(null, 30);
+            cy.center();
+        }
+    }
+}
+
+// Layout customization functions
+function applyLayout(layoutType) {
+    if (!cy || !currentWorkflowData) return;
+
+    const nodesPerRow = 6; // Configurable nodes per row for horizontal/serpentine
+
+    if (layoutType === 'vertical') {
+        // Reapply TB dagre layout
+        cy.layout(GRAPH_LAYOUT).run();
+
+    } else if (layoutType === 'horizontal') {
+        // Manual horizontal layout in rows
+        // Create order map from workflow base_sequence
+        const sequenceOrder = {};
+        currentWorkflowData.workflow.base_sequence.forEach((step, index) => {
+            sequenceOrder[step.operation_id] = index;
+        });
+
+        const nodes = cy.nodes().sort((a, b) => {
+            // Sort by workflow sequence order
+            const orderA = sequenceOrder[a.id()] !== undefined ? sequenceOrder[a.id()] : 999;
+            const orderB = sequenceOrder[b.id()] !== undefined ? sequenceOrder[b.id()] : 999;
+            return orderA - orderB;
+        });
+
+        const nodeWidth = 200;
+        const nodeHeight = 100;
+        const horizontalSpacing = 80;
+        const verticalSpacing = 120;
+
+        nodes.forEach((node, index) => {
+            const row = Math.floor(index / nodesPerRow);
+            const col = index % nodesPerRow;
+
+            node.position({
+                x: col * (nodeWidth + horizontalSpacing),
+                y: row * (nodeHeight + verticalSpacing)
+            });
+        });
+
+    } else if (layoutType === 'serpentine') {
+        // Serpentine/boustrophedon layout (zig-zag)
+        // Create order map from workflow base_sequence
+        const sequenceOrder = {};
+        currentWorkflowData.workflow.base_sequence.forEach((step, index) => {
+            sequenceOrder[step.operation_id] = index;
+        });
+
+        const nodes = cy.nodes().sort((a, b) => {
+            // Sort by workflow sequence order
+            const orderA = sequenceOrder[a.id()] !== undefined ? sequenceOrder[a.id()] : 999;
+            const orderB = sequenceOrder[b.id()] !== undefined ? sequenceOrder[b.id()] : 999;
+            return orderA - orderB;
+        });
+
+        const nodeWidth = 200;
+        const nodeHeight = 100;
+        const horizontalSpacing = 80;
+        const verticalSpacing = 120;
+
+        nodes.forEach((node, index) => {
+            const row = Math.floor(index / nodesPerRow);
+            const colIndex = index % nodesPerRow;
+
+            // Alternate direction on odd rows
+            const col = (row % 2 === 0) ? colIndex : (nodesPerRow - 1 - colIndex);
+
+            node.position({
+                x: col * (nodeWidth + horizontalSpacing),
+                y: row * (nodeHeight + verticalSpacing)
+            });
+        });
+    }
+
+    // Fit and reset zoom after layout change
+    setTimeout(() => {
+        fitGraph();
+    }, 100);
+}
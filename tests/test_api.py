@@ -1,6 +1,14 @@
 """Integration tests for Flask API endpoints."""
-import pytest
+import gzip
+import io
 import json
+import re
+import time
+from concurrent.futures import Future
+from datetime import datetime
+
+import pytest
+from api import routes
 from main import create_app
 
 
@@ -45,17 +53,218 @@ class TestHealthEndpoint:
         assert 'version' in data
 
 
+class TestJsonProvider:
+    """Tests for the orjson-backed JSON provider."""
+
+    def test_app_uses_orjson_provider(self):
+        """Test that the app factory installs the orjson provider."""
+        from api.json_provider import OrjsonProvider
+
+        app = create_app()
+        assert isinstance(app.json, OrjsonProvider)
+
+    def test_serializes_numpy_scalars(self):
+        """Test that NumPy scalars from summary statistics serialize."""
+        import numpy as np
+
+        app = create_app()
+        with app.app_context():
+            response = app.json.response({"mean": np.float64(1.5), "count": np.int64(3)})
+
+        assert response.mimetype == 'application/json'
+        assert json.loads(response.data) == {"mean": 1.5, "count": 3}
+
+
 class TestRootEndpoint:
     """Tests for root endpoint."""
 
     def test_root_endpoint(self, client):
-        """Test that root endpoint returns service info."""
+        """Test that root endpoint serves the HTML interface."""
         response = client.get('/')
         assert response.status_code == 200
+        assert response.mimetype == 'text/html'
+        assert b'<!DOCTYPE html>' in response.data
 
-        data = json.loads(response.data)
-        assert 'service' in data
-        assert 'endpoints' in data
+    def test_root_endpoint_is_cacheable(self, client):
+        """Test that the static index page carries caching headers."""
+        response = client.get('/')
+        assert response.headers['Cache-Control'] == 'public, max-age=3600'
+        assert response.content_length == len(response.data)
+
+    def test_root_endpoint_gzip(self, client):
+        """Test that the index page is served pre-compressed when accepted."""
+        plain = client.get('/')
+        compressed = client.get('/', headers={'Accept-Encoding': 'gzip, deflate'})
+
+        assert 'Content-Encoding' not in plain.headers
+        assert compressed.headers['Content-Encoding'] == 'gzip'
+        assert compressed.headers['Vary'] == 'Accept-Encoding'
+        assert len(compressed.data) < len(plain.data)
+
+        # The compressed copy is minified: same lines, without indentation
+        minified = gzip.decompress(compressed.data)
+        assert len(minified) < len(plain.data)
+        assert minified.splitlines() == [
+            line.strip() for line in plain.data.splitlines() if line.strip()
+        ]
+
+    def test_root_endpoint_not_modified(self, client):
+        """Test that a matching If-None-Match short-circuits with 304."""
+        first = client.get('/')
+        etag = first.headers['ETag']
+
+        response = client.get('/', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+        assert response.headers['ETag'] == etag
+
+        # The gzip representation has a different ETag
+        compressed = client.get('/', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+        assert compressed.status_code == 200
+        assert compressed.headers['ETag'] != etag
+
+
+class TestStaticAssets:
+    """Tests for the index page's stylesheet and script."""
+
+    def test_index_references_fingerprinted_assets(self, client):
+        """Test that asset URLs in the index page carry a content hash."""
+        response = client.get('/')
+        assert re.search(rb'/static/app\.css\?v=[0-9a-f]{12}"', response.data)
+        assert re.search(rb'/static/app\.js\?v=[0-9a-f]{12}"', response.data)
+
+    def test_index_preloads_assets(self, client):
+        """Test that the index response asks the browser to preload its assets."""
+        response = client.get('/')
+        link = response.headers['Link']
+        assert re.search(r'</static/app\.css\?v=[0-9a-f]{12}>; rel=preload; as=style', link)
+        assert re.search(r'</static/app\.js\?v=[0-9a-f]{12}>; rel=preload; as=script', link)
+
+    def test_serve_asset(self, client):
+        """Test that assets are served with a long immutable cache lifetime."""
+        response = client.get('/static/app.js')
+        assert response.status_code == 200
+        assert response.mimetype == 'text/javascript'
+        assert response.cache_control.max_age == 31536000
+        assert response.cache_control.immutable
+
+        compressed = client.get('/static/app.css', headers={'Accept-Encoding': 'gzip'})
+        assert compressed.headers['Content-Encoding'] == 'gzip'
+        assert compressed.mimetype == 'text/css'
+        assert 'immutable' in compressed.headers['Cache-Control']
+
+    def test_x_sendfile_opt_in(self, monkeypatch):
+        """Test that USE_X_SENDFILE hands the file to the front-end server."""
+        monkeypatch.setenv('USE_X_SENDFILE', '1')
+        app = create_app()
+
+        with app.test_client() as client:
+            response = client.get('/static/app.js')
+
+        assert response.status_code == 200
+        assert response.headers['X-Sendfile'].endswith('app.js')
+        assert response.data == b''
+
+    def test_unlisted_static_files_not_served(self, client):
+        """Test that only the referenced assets are exposed under /static."""
+        assert client.get('/static/index.html').status_code == 404
+        assert client.get('/static/missing.js').status_code == 404
+
+
+class TestExampleFiles:
+    """Tests for GET /examples/{filename}."""
+
+    def test_serve_example(self, client):
+        """Test that example workflow files are served as JSON."""
+        response = client.get('/examples/single_sample_pcr.json')
+        assert response.status_code == 200
+        assert 'workflow' in json.loads(response.data)
+
+    def test_serve_example_is_cacheable(self, client):
+        """Test that example files carry caching headers and revalidate."""
+        response = client.get('/examples/single_sample_pcr.json')
+        assert response.headers['Cache-Control'] == 'public, max-age=86400'
+
+        revalidated = client.get(
+            '/examples/single_sample_pcr.json',
+            headers={'If-None-Match': response.headers['ETag']}
+        )
+        assert revalidated.status_code == 304
+
+    def test_serve_example_gzip(self, client):
+        """Test that example files are served pre-compressed when accepted."""
+        plain = client.get('/examples/single_sample_pcr.json')
+        compressed = client.get(
+            '/examples/single_sample_pcr.json',
+            headers={'Accept-Encoding': 'gzip'}
+        )
+
+        assert compressed.headers['Content-Encoding'] == 'gzip'
+        assert compressed.mimetype == 'application/json'
+        assert json.loads(gzip.decompress(compressed.data)) == json.loads(plain.data)
+
+    def test_list_examples(self, client):
+        """Test that all examples are returned in one response, keyed by name."""
+        response = client.get('/api/examples')
+        assert response.status_code == 200
+
+        examples = json.loads(response.data)
+        assert set(examples) >= {'single_sample_pcr', 'synchronized_batch_analyzer'}
+
+        single = client.get('/examples/single_sample_pcr.json')
+        assert examples['single_sample_pcr'] == json.loads(single.data)
+
+    def test_serve_example_head(self, client):
+        """Test that HEAD requests get the headers without a body."""
+        response = client.head('/examples/single_sample_pcr.json')
+        assert response.status_code == 200
+        assert response.content_length > 0
+        assert response.data == b''
+
+    def test_serve_example_not_found(self, client):
+        """Test that unknown example files return 404."""
+        response = client.get('/examples/missing.json')
+        assert response.status_code == 404
+
+
+class TestCorsHeaders:
+    """Tests for cross-origin headers on API responses."""
+
+    def test_api_responses_allow_cross_origin(self, client):
+        """Test that API responses carry CORS headers."""
+        response = client.get('/api/health')
+        assert response.headers['Access-Control-Allow-Origin'] == '*'
+        assert response.headers['Access-Control-Allow-Headers'] == 'Content-Type, Content-Encoding'
+
+    def test_preflight_request(self, client):
+        """Test that a preflight OPTIONS request is answered with CORS headers."""
+        response = client.options('/api/simulate')
+        assert response.status_code == 200
+        assert response.headers['Access-Control-Allow-Origin'] == '*'
+        assert 'POST' in response.headers['Access-Control-Allow-Methods']
+
+    def test_preflight_is_cacheable(self, client):
+        """Test that browsers may cache preflight results."""
+        response = client.options('/api/simulate')
+        assert response.headers['Access-Control-Max-Age'] == '86400'
+
+    def test_allowed_origins(self, monkeypatch):
+        """Test that CORS_ALLOWED_ORIGINS restricts which origins are echoed."""
+        monkeypatch.setenv('CORS_ALLOWED_ORIGINS', 'https://a.example, https://b.example')
+        app = create_app()
+
+        with app.test_client() as client:
+            allowed = client.get('/api/health', headers={'Origin': 'https://b.example'})
+            denied = client.get('/api/health', headers={'Origin': 'https://evil.example'})
+
+        assert allowed.headers['Access-Control-Allow-Origin'] == 'https://b.example'
+        assert 'Origin' in allowed.headers['Vary']
+        assert 'Access-Control-Allow-Origin' not in denied.headers
+
+    def test_index_has_no_cors_headers(self, client):
+        """Test that non-API routes are left without CORS headers."""
+        response = client.get('/')
+        assert 'Access-Control-Allow-Origin' not in response.headers
 
 
 class TestSimulateEndpoint:
@@ -88,6 +297,17 @@ class TestSimulateEndpoint:
         assert 'operation_stats' in summary
         assert 'bottleneck_device' in summary
 
+    def test_run_ids_are_unique_and_time_ordered(self):
+        """Test that generated run IDs are unique and sort by creation time."""
+        from api.routes import _new_run_id
+
+        run_ids = [_new_run_id("sim_run")[0] for _ in range(50)]
+
+        assert len(set(run_ids)) == len(run_ids)
+        assert all(run_id.startswith('sim_run_') for run_id in run_ids)
+        timestamps = [run_id.split('_')[2] for run_id in run_ids]
+        assert timestamps == sorted(timestamps)
+
     def test_simulate_batch_success(self, client, batch_request_data):
         """Test successful batch simulation."""
         response = client.post(
@@ -111,6 +331,16 @@ class TestSimulateEndpoint:
         assert data['status'] == 'error'
         assert 'No JSON data' in data['error_message']
 
+    def test_simulate_malformed_json(self, client):
+        """Test that a malformed JSON body returns 400."""
+        response = client.post(
+            '/api/simulate',
+            data='{"workflow": ',
+            content_type='application/json'
+        )
+        assert response.status_code == 400
+        assert 'No JSON data' in json.loads(response.data)['error_message']
+
     def test_simulate_missing_workflow(self, client, simple_scenario):
         """Test that missing workflow returns 400."""
         response = client.post(
@@ -208,6 +438,113 @@ class TestSimulateEndpoint:
         assert 'bottleneck_utilization' in summary
 
 
+class TestBackgroundSimulation:
+    """Tests for POST /api/simulate?async=true and the status endpoint."""
+
+    @staticmethod
+    def _wait_for_state(client, run_id, timeout=30.0):
+        """Poll the status endpoint until the run leaves the running state."""
+        deadline = time.monotonic() + timeout
+        while True:
+            data = json.loads(client.get(f'/api/simulation/{run_id}/status').data)
+            if data['state'] != 'running' or time.monotonic() > deadline:
+                return data
+            time.sleep(0.05)
+
+    def test_async_simulation_completes(self, client, batch_request_data):
+        """Test that an async run is accepted and its results become available."""
+        response = client.post(
+            '/api/simulate?async=true',
+            data=json.dumps(batch_request_data),
+            content_type='application/json'
+        )
+        assert response.status_code == 202
+
+        data = json.loads(response.data)
+        assert data['status'] == 'accepted'
+        run_id = data['run_id']
+        assert data['status_url'] == f'/api/simulation/{run_id}/status'
+
+        status = self._wait_for_state(client, run_id)
+        assert status['state'] == 'complete'
+        assert status['event_count'] > 0
+
+        summary_response = client.get(f'/api/simulation/{run_id}/summary')
+        assert summary_response.status_code == 200
+        assert json.loads(summary_response.data)['summary']['num_samples_completed'] == 3
+
+    def test_async_validation_errors_are_synchronous(self, client, simple_workflow, synchronized_scenario):
+        """Test that invalid requests are rejected before being submitted."""
+        response = client.post(
+            '/api/simulate?async=true',
+            data=json.dumps({"workflow": simple_workflow, "scenario": synchronized_scenario}),
+            content_type='application/json'
+        )
+        assert response.status_code == 400
+
+    def test_status_of_synchronous_run(self, client, simple_request_data):
+        """Test that synchronous runs report as complete."""
+        sim_response = client.post(
+            '/api/simulate',
+            data=json.dumps(simple_request_data),
+            content_type='application/json'
+        )
+        run_id = json.loads(sim_response.data)['run_id']
+
+        data = json.loads(client.get(f'/api/simulation/{run_id}/status').data)
+        assert data['state'] == 'complete'
+
+    def test_status_not_found(self, client):
+        """Test that invalid run_id returns 404."""
+        response = client.get('/api/simulation/invalid_run_id/status')
+        assert response.status_code == 404
+
+    def test_cancelled_run_reports_failed(self, client):
+        """Test that a cancelled background run is reported as failed."""
+        future = Future()
+        future.cancel()
+        routes._background_runs['sim_run_cancelled'] = future
+        try:
+            routes._finish_background_run('sim_run_cancelled', datetime.now(), future)
+            assert 'sim_run_cancelled' not in routes._background_runs
+
+            data = json.loads(client.get('/api/simulation/sim_run_cancelled/status').data)
+            assert data['state'] == 'failed'
+            assert 'cancelled' in data['error_message']
+        finally:
+            routes._failed_runs.pop('sim_run_cancelled', None)
+
+    def test_store_failure_reports_failed(self, client, monkeypatch):
+        """Test that a run whose results cannot be stored is reported as failed."""
+        def fail_store(*args):
+            raise MemoryError("out of memory")
+
+        monkeypatch.setattr(routes, '_store_simulation', fail_store)
+        future = Future()
+        future.set_result(([], None, 0.0))
+        routes._background_runs['sim_run_unstored'] = future
+        try:
+            routes._finish_background_run('sim_run_unstored', datetime.now(), future)
+            assert 'sim_run_unstored' not in routes._background_runs
+
+            data = json.loads(client.get('/api/simulation/sim_run_unstored/status').data)
+            assert data['state'] == 'failed'
+            assert 'out of memory' in data['error_message']
+        finally:
+            routes._failed_runs.pop('sim_run_unstored', None)
+
+    def test_failed_runs_are_bounded(self, monkeypatch):
+        """Test that only the most recent MAX_STORED_RUNS failures are kept."""
+        monkeypatch.setattr(routes, 'MAX_STORED_RUNS', 2)
+        monkeypatch.setattr(routes, '_failed_runs', routes.OrderedDict())
+        for i in range(3):
+            future = Future()
+            future.cancel()
+            routes._finish_background_run(f'sim_run_{i}', datetime.now(), future)
+
+        assert list(routes._failed_runs) == ['sim_run_1', 'sim_run_2']
+
+
 class TestEventsEndpoint:
     """Tests for GET /api/simulation/{run_id}/events endpoint."""
 
@@ -289,6 +626,78 @@ class TestEventsEndpoint:
         for event in data['events']:
             assert event['event_type'] == 'START'
 
+    def test_get_events_with_combined_filters(self, client, batch_request_data):
+        """Test that multiple filters intersect and report the filtered total."""
+        sim_response = client.post(
+            '/api/simulate',
+            data=json.dumps(batch_request_data),
+            content_type='application/json'
+        )
+        run_id = json.loads(sim_response.data)['run_id']
+
+        all_events = json.loads(client.get(f'/api/simulation/{run_id}/events').data)['events']
+        expected = [
+            e for e in all_events
+            if e['sample_id'] == 'SAMPLE_001' and e['event_type'] == 'COMPLETE'
+        ]
+
+        response = client.get(
+            f'/api/simulation/{run_id}/events?sample_id=SAMPLE_001&event_type=COMPLETE&limit=1&offset=1'
+        )
+        data = json.loads(response.data)
+
+        assert data['total_events'] == len(expected)
+        assert data['event_count'] == 1
+        assert data['events'] == expected[1:2]
+
+        response = client.get(f'/api/simulation/{run_id}/events?sample_id=SAMPLE_999')
+        data = json.loads(response.data)
+        assert data['total_events'] == 0
+        assert data['events'] == []
+
+    def test_get_events_streams_in_batches(self, client, batch_request_data, monkeypatch):
+        """Test that events streamed across several batches form one valid array."""
+        sim_response = client.post(
+            '/api/simulate',
+            data=json.dumps(batch_request_data),
+            content_type='application/json'
+        )
+        sim_data = json.loads(sim_response.data)
+        run_id = sim_data['run_id']
+
+        expected = json.loads(client.get(f'/api/simulation/{run_id}/events').data)['events']
+
+        monkeypatch.setattr(routes, 'EVENT_STREAM_BATCH_SIZE', 2)
+        response = client.get(f'/api/simulation/{run_id}/events')
+        assert response.is_streamed
+
+        data = json.loads(response.data)
+        assert data['events'] == expected
+        assert data['event_count'] == sim_data['event_count']
+        assert data['total_events'] == sim_data['event_count']
+
+    def test_get_events_ndjson(self, client, batch_request_data, monkeypatch):
+        """Test that format=ndjson streams one event object per line."""
+        sim_response = client.post(
+            '/api/simulate',
+            data=json.dumps(batch_request_data),
+            content_type='application/json'
+        )
+        run_id = json.loads(sim_response.data)['run_id']
+
+        expected = json.loads(
+            client.get(f'/api/simulation/{run_id}/events?sample_id=SAMPLE_001').data
+        )['events']
+
+        monkeypatch.setattr(routes, 'EVENT_STREAM_BATCH_SIZE', 2)
+        response = client.get(f'/api/simulation/{run_id}/events?sample_id=SAMPLE_001&format=ndjson')
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        assert response.headers['X-Total-Events'] == str(len(expected))
+
+        lines = response.data.decode().splitlines()
+        assert [json.loads(line) for line in lines] == expected
+
     def test_get_events_with_pagination(self, client, simple_request_data):
         """Test event pagination."""
         # Run simulation
@@ -400,6 +809,19 @@ class TestSummaryEndpoint:
         assert 'sample_count' in op1_stats
         assert op1_stats['sample_count'] == 1
 
+    def test_summary_matches_simulate_response(self, client, simple_request_data):
+        """Test that the cached summary matches the one returned by simulate."""
+        sim_response = client.post(
+            '/api/simulate',
+            data=json.dumps(simple_request_data),
+            content_type='application/json'
+        )
+        sim_data = json.loads(sim_response.data)
+
+        response = client.get(f"/api/simulation/{sim_data['run_id']}/summary")
+        assert response.mimetype == 'application/json'
+        assert json.loads(response.data)['summary'] == sim_data['summary']
+
 
 class TestEndToEndWorkflow:
     """End-to-end workflow tests."""
@@ -462,3 +884,296 @@ class TestEndToEndWorkflow:
         # Different sample counts
         assert data1['summary']['num_samples_completed'] == 1
         assert data2['summary']['num_samples_completed'] == 3
+
+
+class TestUploadResultsEndpoint:
+    """Tests for POST /api/upload-results endpoint."""
+
+    @staticmethod
+    def _export_results(client, request_data):
+        """Run a simulation and build an uploadable results document."""
+        sim_response = client.post(
+            '/api/simulate',
+            data=json.dumps(request_data),
+            content_type='application/json'
+        )
+        run_id = json.loads(sim_response.data)['run_id']
+        events = json.loads(client.get(f'/api/simulation/{run_id}/events').data)['events']
+        summary = json.loads(client.get(f'/api/simulation/{run_id}/summary').data)['summary']
+        return {
+            "run_id": run_id,
+            "workflow": request_data['workflow'],
+            "scenario": request_data['scenario'],
+            "events": events,
+            "summary": summary
+        }
+
+    def test_upload_round_trip(self, client, batch_request_data):
+        """Test that exported results can be uploaded and queried again."""
+        results = self._export_results(client, batch_request_data)
+
+        response = client.post(
+            '/api/upload-results',
+            data={'file': (io.BytesIO(json.dumps(results).encode()), 'results.json')},
+            content_type='multipart/form-data'
+        )
+        assert response.status_code == 200
+
+        data = json.loads(response.data)
+        assert data['status'] == 'success'
+        assert data['run_id'].startswith('uploaded_')
+        assert data['event_count'] == len(results['events'])
+        assert data['samples_completed'] == 3
+
+        events_response = client.get(f"/api/simulation/{data['run_id']}/events")
+        assert json.loads(events_response.data)['events'] == results['events']
+
+        summary_response = client.get(f"/api/simulation/{data['run_id']}/summary")
+        assert json.loads(summary_response.data)['summary'] == results['summary']
+
+    def test_upload_same_file_reuses_run(self, client, simple_request_data, monkeypatch):
+        """Test that re-uploading an identical file returns the stored run."""
+        body = json.dumps(self._export_results(client, simple_request_data)).encode()
+
+        first = json.loads(client.post(
+            '/api/upload-results', data=body, content_type='application/json'
+        ).data)
+        second = json.loads(client.post(
+            '/api/upload-results', data=gzip.compress(body),
+            content_type='application/json', headers={'Content-Encoding': 'gzip'}
+        ).data)
+        assert second == first
+
+        # Once the run is evicted, the file is parsed and stored again
+        monkeypatch.setattr(routes, 'simulation_results', routes.OrderedDict())
+        third = json.loads(client.post(
+            '/api/upload-results', data=body, content_type='application/json'
+        ).data)
+        assert third['status'] == 'success'
+        assert third['run_id'] != first['run_id']
+
+    def test_upload_raw_json_body(self, client, simple_request_data):
+        """Test that results can be uploaded as a raw JSON request body."""
+        results = self._export_results(client, simple_request_data)
+
+        response = client.post(
+            '/api/upload-results',
+            data=json.dumps(results),
+            content_type='application/json'
+        )
+        assert response.status_code == 200
+
+        data = json.loads(response.data)
+        assert data['event_count'] == len(results['events'])
+
+        summary_response = client.get(f"/api/simulation/{data['run_id']}/summary")
+        assert json.loads(summary_response.data)['summary'] == results['summary']
+
+    def test_upload_gzip_json_body(self, client, simple_request_data):
+        """Test that a gzip-encoded raw JSON body is decompressed before parsing."""
+        results = self._export_results(client, simple_request_data)
+
+        response = client.post(
+            '/api/upload-results',
+            data=gzip.compress(json.dumps(results).encode()),
+            content_type='application/json',
+            headers={'Content-Encoding': 'gzip'}
+        )
+        assert response.status_code == 200
+        assert json.loads(response.data)['event_count'] == len(results['events'])
+
+    def test_upload_invalid_gzip_body(self, client):
+        """Test that a body that is not valid gzip returns 400."""
+        response = client.post(
+            '/api/upload-results',
+            data=b'{"events": []}',
+            content_type='application/json',
+            headers={'Content-Encoding': 'gzip'}
+        )
+        assert response.status_code == 400
+        assert 'Invalid gzip' in json.loads(response.data)['error_message']
+
+    def test_upload_too_large(self, client, simple_request_data):
+        """Test that bodies over MAX_CONTENT_LENGTH are rejected with 413."""
+        body = json.dumps(self._export_results(client, simple_request_data)).encode()
+        client.application.config['MAX_CONTENT_LENGTH'] = len(body) - 1
+
+        response = client.post('/api/upload-results', data=body, content_type='application/json')
+        assert response.status_code == 413
+        assert json.loads(response.data)['status'] == 'error'
+
+        response = client.post(
+            '/api/upload-results',
+            data={'file': (io.BytesIO(body), 'results.json')},
+            content_type='multipart/form-data'
+        )
+        assert response.status_code == 413
+
+    def test_simulate_too_large(self, client, simple_request_data):
+        """Test that simulation requests over MAX_CONTENT_LENGTH are rejected with 413."""
+        body = json.dumps(simple_request_data).encode()
+        client.application.config['MAX_CONTENT_LENGTH'] = len(body) - 1
+
+        response = client.post('/api/simulate', data=body, content_type='application/json')
+        assert response.status_code == 413
+        assert json.loads(response.data)['status'] == 'error'
+
+    def test_upload_gzip_decompressed_too_large(self, client):
+        """Test that the size limit also applies to the decompressed body."""
+        client.application.config['MAX_CONTENT_LENGTH'] = 1024
+
+        response = client.post(
+            '/api/upload-results',
+            data=gzip.compress(b' ' * 4096),
+            content_type='application/json',
+            headers={'Content-Encoding': 'gzip'}
+        )
+        assert response.status_code == 413
+
+    def test_upload_invalid_json(self, client):
+        """Test that malformed JSON returns 400."""
+        response = client.post(
+            '/api/upload-results',
+            data={'file': (io.BytesIO(b'{not json'), 'results.json')},
+            content_type='multipart/form-data'
+        )
+        assert response.status_code == 400
+
+        data = json.loads(response.data)
+        assert data['status'] == 'error'
+        assert 'Invalid JSON' in data['error_message']
+
+    def test_upload_missing_fields(self, client):
+        """Test that a document without required fields returns 400."""
+        response = client.post(
+            '/api/upload-results',
+            data={'file': (io.BytesIO(b'{"events": []}'), 'results.json')},
+            content_type='multipart/form-data'
+        )
+        assert response.status_code == 400
+        assert 'Missing required fields' in json.loads(response.data)['error_message']
+
+
+class TestResultStorage:
+    """Tests for bounded in-memory result storage."""
+
+    def test_least_recently_used_run_evicted(self, client, simple_request_data, monkeypatch):
+        """Test that the least recently used run is evicted when storage is full."""
+        monkeypatch.setattr(routes, 'MAX_STORED_RUNS', 2)
+        monkeypatch.setattr(routes, 'simulation_results', routes.OrderedDict())
+
+        run_ids = []
+        for _ in range(2):
+            response = client.post(
+                '/api/simulate',
+                data=json.dumps(simple_request_data),
+                content_type='application/json'
+            )
+            run_ids.append(json.loads(response.data)['run_id'])
+
+        # Touch the oldest run so the second one becomes least recently used
+        assert client.get(f'/api/simulation/{run_ids[0]}/summary').status_code == 200
+
+        response = client.post(
+            '/api/simulate',
+            data=json.dumps(simple_request_data),
+            content_type='application/json'
+        )
+        run_ids.append(json.loads(response.data)['run_id'])
+
+        assert len(routes.simulation_results) == 2
+        assert client.get(f'/api/simulation/{run_ids[0]}/summary').status_code == 200
+        assert client.get(f'/api/simulation/{run_ids[1]}/summary').status_code == 404
+        assert client.get(f'/api/simulation/{run_ids[2]}/summary').status_code == 200
+
+
+class TestVisualizationEndpoints:
+    """Tests for GET /api/simulation/{run_id}/visualize/* endpoints."""
+
+    def test_gantt_returns_html(self, client, simple_request_data):
+        """Test that the Gantt chart endpoint returns an HTML page."""
+        sim_response = client.post(
+            '/api/simulate',
+            data=json.dumps(simple_request_data),
+            content_type='application/json'
+        )
+        run_id = json.loads(sim_response.data)['run_id']
+
+        response = client.get(f'/api/simulation/{run_id}/visualize/gantt')
+        assert response.status_code == 200
+        assert response.mimetype == 'text/html'
+        assert b'<html>' in response.data
+
+    def test_visualize_not_found(self, client):
+        """Test that invalid run_id returns 404."""
+        response = client.get('/api/simulation/invalid_run_id/visualize/dashboard')
+        assert response.status_code == 404
+
+    def test_rendered_chart_is_cached(self, client, simple_request_data, monkeypatch):
+        """Test that repeated requests reuse the rendered page."""
+        sim_response = client.post(
+            '/api/simulate',
+            data=json.dumps(simple_request_data),
+            content_type='application/json'
+        )
+        run_id = json.loads(sim_response.data)['run_id']
+
+        calls = []
+        original = routes.create_utilization_chart
+
+        def counting_chart(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(routes, 'create_utilization_chart', counting_chart)
+
+        first = client.get(f'/api/simulation/{run_id}/visualize/utilization')
+        second = client.get(f'/api/simulation/{run_id}/visualize/utilization')
+
+        assert first.data == second.data
+        assert len(calls) == 1
+
+    def test_unused_query_parameters_share_cached_chart(self, client, simple_request_data, monkeypatch):
+        """Test that query parameters a chart does not read do not cause re-renders."""
+        sim_response = client.post(
+            '/api/simulate',
+            data=json.dumps(simple_request_data),
+            content_type='application/json'
+        )
+        run_id = json.loads(sim_response.data)['run_id']
+
+        calls = []
+        original = routes.create_queue_timeline
+
+        def counting_chart(*args, **kwargs):
+            calls.append(kwargs.get('device_id'))
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(routes, 'create_queue_timeline', counting_chart)
+
+        for query in ('', '?x=1', '?x=2', '?device_id=dev1', '?device_id=dev1&x=1'):
+            assert client.get(f'/api/simulation/{run_id}/visualize/queue{query}').status_code == 200
+
+        assert calls == [None, 'dev1']
+
+    def test_evicted_run_charts_dropped(self, client, simple_request_data, monkeypatch):
+        """Test that a run's cached charts are removed when the run is evicted."""
+        monkeypatch.setattr(routes, 'MAX_STORED_RUNS', 1)
+        monkeypatch.setattr(routes, 'simulation_results', routes.OrderedDict())
+        monkeypatch.setattr(routes, '_chart_cache', routes.OrderedDict())
+
+        sim_response = client.post(
+            '/api/simulate',
+            data=json.dumps(simple_request_data),
+            content_type='application/json'
+        )
+        run_id = json.loads(sim_response.data)['run_id']
+        client.get(f'/api/simulation/{run_id}/visualize/utilization')
+        assert [key[0] for key in routes._chart_cache] == [run_id]
+
+        client.post(
+            '/api/simulate',
+            data=json.dumps(simple_request_data),
+            content_type='application/json'
+        )
+        assert len(routes._chart_cache) == 0
@@ -1,4 +1,7 @@
 """Unit tests for simulation data models."""
+from dataclasses import asdict
+
+import orjson
 import pytest
 from src.simulation.models import (
     SimulationEvent,
@@ -50,6 +53,107 @@ class TestSimulationEvent:
         )
         assert event.notes == ""
 
+    def test_orjson_encoding_matches_asdict(self):
+        """Test that orjson encodes the dataclass exactly like its dict form."""
+        event = SimulationEvent(
+            timestamp=10.5,
+            event_type="COMPLETE",
+            sample_id="SAMPLE_001",
+            operation_id="op1",
+            device_id="dev1",
+            duration=5.0,
+            wait_time=2.0,
+            device_queue_length=0
+        )
+        assert orjson.dumps(event) == orjson.dumps(asdict(event))
+
+    def test_from_dict_round_trip(self):
+        """Test that from_dict rebuilds an event from its serialized form."""
+        event = SimulationEvent(
+            timestamp=3.0,
+            event_type="START",
+            sample_id="SAMPLE_002",
+            operation_id="op2",
+            device_id="dev2",
+            duration=0.0,
+            wait_time=1.5,
+            device_queue_length=0,
+            notes="resumed"
+        )
+        assert SimulationEvent.from_dict(orjson.loads(orjson.dumps(event))) == event
+
+    def test_from_dict_defaults_notes(self):
+        """Test that from_dict applies the default for missing notes."""
+        event_dict = {
+            "timestamp": 0.0,
+            "event_type": "QUEUED",
+            "sample_id": "SAMPLE_000",
+            "operation_id": "op1",
+            "device_id": "dev1",
+            "duration": 0.0,
+            "wait_time": 0.0,
+            "device_queue_length": 2
+        }
+        assert SimulationEvent.from_dict(event_dict).notes == ""
+
+    def test_from_dict_interns_identifiers(self):
+        """Test that from_dict shares identifier strings across events."""
+        events = [
+            SimulationEvent.from_dict(orjson.loads(
+                b'{"timestamp": 0.0, "event_type": "QUEUED", "sample_id": "SAMPLE_000",'
+                b' "operation_id": "op1", "device_id": "dev1", "duration": 0.0,'
+                b' "wait_time": 0.0, "device_queue_length": 0}'
+            ))
+            for _ in range(2)
+        ]
+        assert events[0].event_type is events[1].event_type
+        assert events[0].sample_id is events[1].sample_id
+        assert events[0].operation_id is events[1].operation_id
+        assert events[0].device_id is events[1].device_id
+
+    def test_from_dict_rejects_unknown_fields(self):
+        """Test that from_dict rejects keys that are not event fields."""
+        with pytest.raises(TypeError, match="unexpected fields: queue_length"):
+            SimulationEvent.from_dict({
+                "timestamp": 0.0,
+                "event_type": "QUEUED",
+                "sample_id": "SAMPLE_000",
+                "operation_id": "op1",
+                "device_id": "dev1",
+                "duration": 0.0,
+                "wait_time": 0.0,
+                "device_queue_length": 0,
+                "queue_length": 0
+            })
+
+    def test_from_dict_validates_fields(self):
+        """Test that from_dict still runs field validation."""
+        with pytest.raises(ValueError, match="event_type must be one of"):
+            SimulationEvent.from_dict({
+                "timestamp": 0.0,
+                "event_type": "UNKNOWN",
+                "sample_id": "SAMPLE_000",
+                "operation_id": "op1",
+                "device_id": "dev1",
+                "duration": 0.0,
+                "wait_time": 0.0,
+                "device_queue_length": 0
+            })
+
+    def test_event_uses_slots(self):
+        """Test that events are slotted and carry no instance __dict__."""
+        event = SimulationEvent(
+            timestamp=0.0,
+            event_type="QUEUED",
+            sample_id="SAMPLE_000",
+            operation_id="op1",
+            device_id="dev1",
+            duration=0.0,
+            wait_time=0.0,
+            device_queue_length=0
+        )
+        assert not hasattr(event, '__dict__')
+
     def test_negative_timestamp_raises_error(self):
         """Test that negative timestamp raises ValueError."""
         with pytest.raises(ValueError, match="timestamp must be non-negative"):
@@ -137,6 +241,35 @@ class TestSimulationEvent:
             )
 
 
+class TestStatsFromDict:
+    """Tests for the from_dict constructors of the nested statistics."""
+
+    def test_round_trip(self):
+        """Test that from_dict inverts to_dict for each statistics type."""
+        queue_stats = DeviceQueueStats(3, 1.5, 4.5, 3)
+        op_stats = OperationStats(10.0, 1.0, 8.0, 12.0, 10.0, 5)
+        wait_stats = OperationWaitStats(2.0, 6.0, 3)
+
+        assert DeviceQueueStats.from_dict(queue_stats.to_dict()) == queue_stats
+        assert OperationStats.from_dict(op_stats.to_dict()) == op_stats
+        assert OperationWaitStats.from_dict(wait_stats.to_dict()) == wait_stats
+
+    def test_missing_fields_use_defaults(self):
+        """Test that missing fields fall back to the dataclass defaults."""
+        assert DeviceQueueStats.from_dict({}) == DeviceQueueStats()
+        assert OperationStats.from_dict({"sample_count": 2}) == OperationStats(sample_count=2)
+        assert OperationWaitStats.from_dict({}) == OperationWaitStats()
+
+    def test_unknown_fields_rejected(self):
+        """Test that keys that are not statistics fields are rejected."""
+        with pytest.raises(TypeError, match="unexpected fields: max_queue"):
+            DeviceQueueStats.from_dict({"max_queue": 3})
+        with pytest.raises(TypeError, match="unexpected fields: mean"):
+            OperationStats.from_dict({"mean": 10.0, "sample_count": 2})
+        with pytest.raises(TypeError, match="unexpected fields: waits"):
+            OperationWaitStats.from_dict({"waits": 1})
+
+
 class TestSimulationSummary:
     """Tests for SimulationSummary dataclass."""
 
@@ -167,6 +300,35 @@ class TestSimulationSummary:
         assert summary.num_samples_completed == 5
         assert summary.bottleneck_device == "dev1"
 
+    def test_to_dict_matches_asdict(self):
+        """Test that to_dict produces the same structure as dataclasses.asdict."""
+        summary = SimulationSummary(
+            total_simulation_time=100.0,
+            num_samples_completed=5,
+            num_samples_failed=0,
+            device_utilization={"dev1": 0.85},
+            device_queue_stats={
+                "dev1": DeviceQueueStats(max_queue_length=2, avg_queue_time=10.0)
+            },
+            operation_stats={
+                "op1": OperationStats(mean_duration=10.0, sample_count=5)
+            },
+            operation_wait_times={
+                "op1": OperationWaitStats(mean_wait=2.0, total_wait=10.0, wait_events=5)
+            },
+            total_throughput=0.05,
+            mean_sample_cycle_time=20.0,
+            min_sample_cycle_time=18.0,
+            max_sample_cycle_time=22.0,
+            bottleneck_device="dev1",
+            bottleneck_utilization=0.85
+        )
+        summary_dict = summary.to_dict()
+        assert summary_dict == asdict(summary)
+        assert summary_dict['device_queue_stats']['dev1']['max_queue_length'] == 2
+        assert summary_dict['operation_stats']['op1']['sample_count'] == 5
+        assert summary_dict['operation_wait_times']['op1']['wait_events'] == 5
+
     def test_negative_simulation_time_raises_error(self):
         """Test that negative simulation time raises ValueError."""
         with pytest.raises(ValueError, match="total_simulation_time must be non-negative"):
@@ -1,7 +1,9 @@
 """Integration tests for SimulationEngine."""
 import pytest
 import numpy as np
-from src.simulation.core import SimulationEngine
+import simpy
+from src.simulation import core
+from src.simulation.core import SimulationEngine, run_batch
 from src.simulation.timing import set_random_seed
 
 
@@ -411,6 +413,70 @@ class TestDeterministicBehavior:
         assert summary.num_samples_completed == 1
 
 
+class TestSingleSlotResource:
+    """Tests for the single-capacity device resource."""
+
+    def test_matches_simpy_resource(self, multi_device_workflow, synchronized_scenario, monkeypatch):
+        """Test that single-slot devices schedule exactly like simpy.Resource."""
+        synchronized_scenario['sample_entry_pattern']['num_samples'] = 10
+
+        engine = SimulationEngine(multi_device_workflow, synchronized_scenario)
+        events, summary = engine.run()
+        assert isinstance(engine.resources['liquid_handler'], core._SingleSlotResource)
+
+        monkeypatch.setattr(core, '_SingleSlotResource', lambda env: simpy.Resource(env, capacity=1))
+        expected_events, expected_summary = SimulationEngine(
+            multi_device_workflow, synchronized_scenario
+        ).run()
+
+        assert events == expected_events
+        assert summary == expected_summary
+
+
+class TestSummaryOnlyRuns:
+    """Tests for running without recording the event log."""
+
+    def test_summary_matches_recorded_run(self, multi_device_workflow, synchronized_scenario):
+        """Test that skipping the event log leaves the summary unchanged."""
+        events, summary = SimulationEngine(multi_device_workflow, synchronized_scenario).run()
+
+        engine = SimulationEngine(multi_device_workflow, synchronized_scenario, record_events=False)
+        summary_only_events, summary_only = engine.run()
+
+        assert len(events) > 0
+        assert summary_only_events == []
+        assert engine.event_log == []
+        assert summary_only == summary
+
+
+class TestRunBatch:
+    """Tests for running independent simulations in parallel."""
+
+    def test_run_batch_matches_serial_runs(self, multi_device_workflow, synchronized_scenario):
+        """Test that seeded jobs give the same results in workers as run serially."""
+        jobs = []
+        for seed in (1, 2, 3):
+            scenario = {**synchronized_scenario, 'simulation_config': {'random_seed': seed}}
+            jobs.append((multi_device_workflow, scenario))
+
+        results = run_batch(jobs, max_workers=2)
+
+        assert len(results) == len(jobs)
+        for (workflow, scenario), (events, summary) in zip(jobs, results):
+            expected_events, expected_summary = SimulationEngine(workflow, scenario).run()
+            assert events == expected_events
+            assert summary == expected_summary
+
+    def test_run_batch_without_events(self, multi_device_workflow, synchronized_scenario):
+        """Test that record_events=False returns summaries with empty event logs."""
+        jobs = [(multi_device_workflow, synchronized_scenario)]
+
+        (events, summary), = run_batch(jobs, max_workers=1, record_events=False)
+
+        assert events == []
+        assert summary == SimulationEngine(multi_device_workflow, synchronized_scenario).run()[1]
+
+
 class TestEventLogContent:
     """Tests for event log content and structure."""
 
@@ -503,6 +569,22 @@ class TestSummaryStatistics:
         assert abs(summary.mean_sample_cycle_time - 10.0) < 0.1
         assert abs(summary.min_sample_cycle_time - 10.0) < 0.1
         assert abs(summary.max_sample_cycle_time - 10.0) < 0.1
+        assert type(summary.mean_sample_cycle_time) is float
+        assert type(summary.min_sample_cycle_time) is float
+        assert type(summary.max_sample_cycle_time) is float
+
+    def test_incomplete_samples_excluded_from_cycle_times(self, simple_workflow, simple_scenario):
+        """Test that samples cut off by the time limit do not count as completed."""
+        simple_scenario['sample_entry_pattern'] = {'pattern_type': 'synchronized', 'num_samples': 3}
+        simple_scenario['simulation_config']['max_simulation_time'] = 25.0
+
+        engine = SimulationEngine(simple_workflow, simple_scenario)
+        _, summary = engine.run()
+
+        # Samples share one device with a 10 second operation
+        assert summary.num_samples_completed == 2
+        assert abs(summary.min_sample_cycle_time - 10.0) < 0.1
+        assert abs(summary.max_sample_cycle_time - 20.0) < 0.1
 
 
 class TestErrorHandling:
@@ -531,6 +613,18 @@ class TestErrorHandling:
         with pytest.raises(ValueError, match="not found in workflow definition"):
             engine.run()
 
+    def test_missing_operation_detected_before_simulating(self, simple_workflow, simple_scenario):
+        """Test that a missing operation in a later step fails before any event is logged."""
+        simple_workflow['base_sequence'].append(
+            {"sequence_id": 2, "operation_id": "missing_op", "predecessors": ["op1"]}
+        )
+
+        engine = SimulationEngine(simple_workflow, simple_scenario)
+
+        with pytest.raises(ValueError, match="'missing_op' not found in workflow definition"):
+            engine.run()
+        assert engine.event_log == []
+
     def test_max_simulation_time_limits_execution(self, simple_workflow, simple_scenario):
         """Test that max_simulation_time limits execution."""
         # Set very short max time
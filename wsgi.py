@@ -0,0 +1,14 @@
+"""WSGI entry point for production servers.
+
+Simulation runs, rendered charts and upload lookups are held in memory by
+the process that created them, so every run endpoint needs a single
+process until a shared store exists. Scale with threads rather than
+workers.
+
+Example:
+    gunicorn -w 1 -k gthread --threads 8 -b 0.0.0.0:5001 wsgi:app
+"""
+from main import configure_logging, create_app
+
+configure_logging()
+app = create_app()